@@ -0,0 +1,84 @@
+"""Redraw time of the player trend chart when switching players.
+
+Compares rebuilding a figure for every selection against updating one
+TrendPlot in place (blitting when the axes still fit). Uses matplotlib's
+Agg canvas, so no display is needed; embedding in Tk adds a constant copy
+to the screen on top. Run from the repository root:
+
+    python3 benchmarks/bench_charts.py --games 82 1000 100000
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from nba_analyzer import analysis, charts
+from nba_analyzer.ui import PlayerAnalysisTab
+
+PANELS = PlayerAnalysisTab.CHART_PANELS
+WINDOW = PlayerAnalysisTab.TREND_WINDOW
+
+
+def make_trends(games: int, seed: int) -> pd.DataFrame:
+    """Rolling trends for a synthetic player's game log."""
+    rng = np.random.default_rng(seed)
+    attempts = {col: rng.integers(0, 20, games) for col in ("FGA", "FG3A", "FTA")}
+    log = pd.DataFrame({
+        "GAME_DATE": pd.date_range("2000-10-30", periods=games, freq="h"),
+        "PTS": rng.integers(0, 50, games),
+        **attempts,
+        **{col[:-1] + "M": rng.binomial(attempts[col], 0.45) for col in attempts},
+    })
+    return analysis.player_trends(log, WINDOW)
+
+
+def rebuild(trends: pd.DataFrame):
+    """The naive path: a new figure with freshly plotted lines for every selection."""
+    figure = Figure(figsize=(8, 3.6), dpi=100)
+    canvas = FigureCanvasAgg(figure)
+    axes = figure.subplots(len(PANELS), 1, sharex=True)
+    for ax, (title, series, ylim) in zip(axes, PANELS):
+        ax.set_title(title, fontsize=9, loc="left")
+        for column, label in series:
+            ax.plot(trends["GAME_DATE"], trends[column], label=label)
+        if ylim:
+            ax.set_ylim(*ylim)
+    figure.tight_layout()
+    canvas.draw()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--games", type=int, nargs="+", default=[82, 1_000, 100_000])
+    parser.add_argument("--switches", type=int, default=20)
+    args = parser.parse_args()
+
+    for games in args.games:
+        selections = [make_trends(games, seed) for seed in range(args.switches)]
+        figure = Figure(figsize=(8, 3.6), dpi=100)
+        plot = charts.TrendPlot(figure, FigureCanvasAgg(figure), PANELS, dates=True)
+        plot.update(selections[0]["GAME_DATE"].to_numpy(), selections[0])
+
+        timings = {"rebuild": [], "in_place": []}
+        for trends in selections:
+            start = time.perf_counter()
+            rebuild(trends)
+            timings["rebuild"].append(time.perf_counter() - start)
+            start = time.perf_counter()
+            plot.update(trends["GAME_DATE"].to_numpy(), trends)
+            timings["in_place"].append(time.perf_counter() - start)
+        print(f"games={games} " + " ".join(
+            f"{name}_p50_ms={statistics.median(t) * 1000:.1f} {name}_max_ms={max(t) * 1000:.1f}"
+            for name, t in timings.items()))
+
+
+if __name__ == "__main__":
+    main()
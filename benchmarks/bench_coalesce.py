@@ -0,0 +1,66 @@
+"""Upstream requests sent for bursts of identical concurrent lookups.
+
+Simulates double-clicks and overlapping tabs: for each fixture, `--callers`
+threads ask for the same player-season at once against a FakeStatsServer
+with a response cache. Without coalescing every caller that misses the cache
+goes upstream; with it, each burst sends one request. Run from the
+repository root:
+
+    python3 benchmarks/bench_coalesce.py --callers 8 --latency 0.05
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from nba_analyzer import api, cache, fixtures
+
+from suite import PLAYER_IDS, SEASONS, prepare_fixtures
+
+
+def burst(player_id: int, season: str, callers: int):
+    """Starts `callers` threads fetching the same game log together and waits for them."""
+    barrier = threading.Barrier(callers)
+
+    def call():
+        barrier.wait()
+        api.get_player_game_log(player_id, season)
+
+    threads = [threading.Thread(target=call) for _ in range(callers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--fixtures", default=os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures"))
+    parser.add_argument("--callers", type=int, default=8)
+    parser.add_argument("--latency", type=float, default=0.05, help="Seconds the fake server waits per request.")
+    args = parser.parse_args()
+
+    prepare_fixtures(args.fixtures)
+    api.set_warehouse(None)
+    api.set_rate_limit(1000, 1000)
+    with tempfile.TemporaryDirectory() as d, fixtures.FakeStatsServer(args.fixtures, latency=args.latency) as server:
+        api.set_cache(cache.ResponseCache(os.path.join(d, "cache.sqlite")))
+        api.set_transport(server.transport())
+        before = api.fetch_stats()
+        start = time.perf_counter()
+        for player_id in PLAYER_IDS:
+            for season in SEASONS:
+                burst(player_id, season, args.callers)
+        elapsed = time.perf_counter() - start
+        stats = {name: count - before[name] for name, count in api.fetch_stats().items()}
+        print(f"bursts={len(PLAYER_IDS) * len(SEASONS)} callers={args.callers} "
+              f"upstream_requests={server.requests} hits={stats['hits']} misses={stats['misses']} "
+              f"coalesced={stats['coalesced']} elapsed_s={elapsed:.3f}")
+
+
+if __name__ == "__main__":
+    main()
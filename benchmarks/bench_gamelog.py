@@ -0,0 +1,75 @@
+"""Speed of analysis.process_player_gamelog against the old per-row apply path.
+
+Run from the repository root:
+
+    python3 benchmarks/bench_gamelog.py --rows 1000 100000 2000000
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from nba_analyzer import analysis
+
+TEAMS = ["ATL", "BOS", "BKN", "CHA", "CHI", "CLE", "DAL", "DEN", "DET", "GSW", "HOU", "IND", "LAC", "LAL", "MEM",
+         "MIA", "MIL", "MIN", "NOP", "NYK", "OKC", "ORL", "PHI", "PHX", "POR", "SAC", "SAS", "TOR", "UTA", "WAS"]
+
+
+def make_log(rows: int) -> pd.DataFrame:
+    """Builds a synthetic league-wide game log shaped like PlayerGameLog output."""
+    rng = np.random.default_rng(0)
+    team = rng.choice(TEAMS, rows)
+    opponent = rng.choice(TEAMS, rows)
+    separator = rng.choice([" vs. ", " @ "], rows)
+    dates = pd.to_datetime("1996-11-01") + pd.to_timedelta(rng.integers(0, 10_000, rows), unit="D")
+    return pd.DataFrame({
+        "SEASON_ID": rng.choice(["21996", "22010", "22023"], rows),
+        "Player_ID": rng.integers(1, 5000, rows),
+        "GAME_DATE": dates.strftime("%b %d, %Y").str.upper(),
+        "MATCHUP": np.char.add(np.char.add(team, separator), opponent),
+        "WL": rng.choice(["W", "L"], rows),
+        "MIN": rng.integers(0, 48, rows),
+        "PTS": rng.integers(0, 60, rows),
+        "FG_PCT": rng.random(rows).round(3),
+    })
+
+
+def legacy_process(stats_df: pd.DataFrame) -> pd.DataFrame:
+    """The original apply-based implementation, extended to the same derived columns."""
+    stats_df["LOCATION"] = stats_df["MATCHUP"].apply(lambda x: "Home" if "vs." in x else "Away")
+    stats_df["TEAM_ABBREVIATION"] = stats_df["MATCHUP"].apply(lambda x: x.split(" ")[0])
+    stats_df["OPPONENT"] = stats_df["MATCHUP"].apply(lambda x: x.split(" ")[-1])
+    stats_df["GAME_DATE"] = pd.to_datetime(stats_df["GAME_DATE"], format=analysis.GAME_DATE_FORMAT)
+    stats_df["MIN"] = pd.to_numeric(stats_df["MIN"])
+    return stats_df
+
+
+def timed(func, df: pd.DataFrame) -> tuple[float, pd.DataFrame]:
+    start = time.perf_counter()
+    result = func(df)
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[1_000, 100_000, 1_000_000])
+    args = parser.parse_args()
+
+    for rows in args.rows:
+        df = make_log(rows)
+        legacy_time, legacy = timed(legacy_process, df.copy())
+        new_time, new = timed(analysis.process_player_gamelog, df)
+        assert (legacy["LOCATION"].to_numpy() == new["LOCATION"].astype(str).to_numpy()).all()
+        print(f"rows={rows} legacy_s={legacy_time:.3f} vectorized_s={new_time:.3f} "
+              f"speedup={legacy_time / new_time:.1f}x "
+              f"memory_mb={legacy.memory_usage(deep=True).sum() / 2**20:.1f}->"
+              f"{new.memory_usage(deep=True).sum() / 2**20:.1f}")
+
+
+if __name__ == "__main__":
+    main()
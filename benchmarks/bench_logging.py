@@ -0,0 +1,82 @@
+"""Calling-thread cost of a log call: the old synchronous DEBUG setup vs logs.configure().
+
+The old setup is what the scripts used to install with basicConfig: root at
+DEBUG, a FileHandler and a StreamHandler written on the calling thread. The
+new one is logs.configure() at its default INFO level, where a call only
+enqueues the record for the background writer. Console output goes to
+os.devnull in both. Times each call individually. Run from the repository root:
+
+    python3 benchmarks/bench_logging.py --calls 20000
+"""
+
+import argparse
+import logging
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from nba_analyzer import logs, telemetry
+
+logger = logging.getLogger("nba_analyzer.api")
+
+
+def sync_setup(path: str, devnull):
+    logging.basicConfig(level=logging.DEBUG, format=logs.TEXT_FORMAT, force=True,
+                        handlers=[logging.FileHandler(path), logging.StreamHandler(devnull)])
+
+def queue_setup(path: str, devnull):
+    stderr, sys.stderr = sys.stderr, devnull  # The console handler binds sys.stderr when created.
+    try:
+        logs.configure(path)
+    finally:
+        sys.stderr = stderr
+
+def teardown():
+    logs.shutdown()
+    root = logging.getLogger()
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+        handler.close()
+
+def span(i):
+    with telemetry.span("api.parse", endpoint="playergamelog") as s:
+        s["rows"] = i
+
+CALLS = {
+    "info_with_timing": lambda i: logger.info("Fetched %s in %.1f ms", "playergamelog", 12.5,
+                                              extra={"endpoint": "playergamelog", "duration_ms": 12.5, "rows": i}),
+    "debug": lambda i: logger.debug("Row %d parsed", i),
+    "telemetry_span": span,
+}
+
+def time_calls(call, n: int) -> list[int]:
+    timings = []
+    for i in range(n):
+        start = time.perf_counter_ns()
+        call(i)
+        timings.append(time.perf_counter_ns() - start)
+    return sorted(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=20_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as d, open(os.devnull, "w") as devnull:
+        for name, setup in (("sync_debug", sync_setup), ("queue_json", queue_setup)):
+            path = os.path.join(d, f"{name}.log")
+            setup(path, devnull)
+            for call_name, call in CALLS.items():
+                timings = time_calls(call, args.calls)
+                print(f"{name:<11} {call_name:<17} p50_us={statistics.median(timings) / 1000:6.2f} "
+                      f"p99_us={timings[int(0.99 * len(timings))] / 1000:7.2f} max_us={timings[-1] / 1000:9.1f}")
+            teardown()
+            print(f"{name:<11} file_bytes={os.path.getsize(path)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""Memory footprint of league-wide game logs and the roster, before and after compaction.
+
+Builds a synthetic full-league log shaped like PlayerGameLog's raw
+get_data_frames() output (object strings, int64/float64 numbers) and
+compares it with analysis.compact(). The roster compares nba_api's player
+dicts with registry records. Run from the repository root:
+
+    python3 benchmarks/bench_memory.py --players 450 --seasons 10
+"""
+
+import argparse
+import gc
+import os
+import sys
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from nba_api.stats.endpoints import playergamelog
+from nba_api.stats.static import players
+
+from bench_gamelog import TEAMS
+from nba_analyzer import analysis, registry
+
+COLUMNS = playergamelog.PlayerGameLog.expected_data["PlayerGameLog"]
+PERCENTAGES = {"FG_PCT", "FG3_PCT", "FT_PCT"}
+
+
+def make_league_log(n_players: int, n_seasons: int, games: int = 82) -> pd.DataFrame:
+    """Builds raw game logs for every player-season, as the API returns them."""
+    rng = np.random.default_rng(0)
+    rows = n_players * n_seasons * games
+    season = np.repeat(np.arange(2023 - n_seasons, 2023), n_players * games)
+    team = rng.choice(TEAMS, rows)
+    opponent = rng.choice(TEAMS, rows)
+    separator = rng.choice([" vs. ", " @ "], rows)
+    opening_night = pd.to_datetime(np.char.add(season.astype(str), "-10-20"))
+    dates = opening_night + pd.to_timedelta(rng.integers(0, 175, rows), unit="D")
+    df = pd.DataFrame({
+        "SEASON_ID": np.char.add("2", season.astype(str)).astype(object),
+        "Player_ID": np.tile(np.repeat(np.arange(1, n_players + 1), games), n_seasons),
+        "Game_ID": np.char.add("002", rng.integers(10_000_000, 10_001_230, rows).astype(str)).astype(object),
+        "GAME_DATE": dates.strftime("%b %d, %Y").str.upper().to_numpy(dtype=object),
+        "MATCHUP": np.char.add(np.char.add(team, separator), opponent).astype(object),
+        "WL": rng.choice(["W", "L"], rows).astype(object),
+    })
+    for col in COLUMNS[len(df.columns):]:
+        df[col] = rng.random(rows).round(3) if col in PERCENTAGES else rng.integers(0, 40, rows)
+    return df
+
+
+def allocated(build) -> tuple[int, object]:
+    """Returns the bytes still allocated by build()'s result, and the result."""
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return size, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--players", type=int, default=450)
+    parser.add_argument("--seasons", type=int, default=10)
+    args = parser.parse_args()
+
+    raw = make_league_log(args.players, args.seasons)
+    raw_mb = raw.memory_usage(deep=True).sum() / 2**20
+    compacted = analysis.compact(raw.copy())
+    compact_mb = compacted.memory_usage(deep=True).sum() / 2**20
+    print(f"game_logs rows={len(raw)} raw_mb={raw_mb:.1f} compact_mb={compact_mb:.1f} "
+          f"reduction={raw_mb / compact_mb:.1f}x")
+
+    dict_bytes, dicts = allocated(players.get_players)
+    record_bytes, records = allocated(registry.load_players)
+    print(f"roster players={len(records)} dicts_kb={dict_bytes / 1024:.0f} records_kb={record_bytes / 1024:.0f} "
+          f"reduction={dict_bytes / record_bytes:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
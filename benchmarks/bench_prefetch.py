@@ -0,0 +1,70 @@
+"""Click latency for a patterned browsing session, with and without prefetching.
+
+Replays what player_stats.log shows users doing: one player at a time,
+stepping back through consecutive seasons with a pause between clicks.
+Requests go to a FakeStatsServer with the given latency and no response
+cache, so every click not served by a prefetch waits for the server.
+Reports per-click latency plus the prefetcher's hit rate and wasted
+fetches. Run from the repository root:
+
+    python3 benchmarks/bench_prefetch.py --latency 0.3 --think 0.5
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from nba_analyzer import api, fixtures, prefetch
+
+from suite import PLAYER_IDS, SEASONS, prepare_fixtures
+
+
+def session(prefetcher, think: float) -> list[float]:
+    """Views every fixture season of each player, newest first; returns click latencies in seconds."""
+    latencies = []
+    for player_id in PLAYER_IDS:
+        for season in sorted(SEASONS, reverse=True):
+            start = time.perf_counter()
+            if prefetcher is None:
+                api.get_player_game_log(player_id, season)
+            else:
+                prefetcher.get(api.get_player_game_log, player_id, season)
+                prefetcher.schedule(prefetch.after_player_season(player_id, season))
+            latencies.append(time.perf_counter() - start)
+            time.sleep(think)
+    return latencies
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--fixtures", default=os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures"))
+    parser.add_argument("--latency", type=float, default=0.3, help="Seconds the fake server waits per request.")
+    parser.add_argument("--think", type=float, default=0.5, help="Seconds between clicks.")
+    parser.add_argument("--budget", type=int, default=20, help="Prefetches allowed per minute.")
+    args = parser.parse_args()
+
+    prepare_fixtures(args.fixtures)
+    api.set_cache(None)
+    api.set_warehouse(None)
+    api.set_rate_limit(1000, 1000)
+    with fixtures.FakeStatsServer(args.fixtures, latency=args.latency) as server:
+        api.set_transport(server.transport())
+        results = {"no_prefetch": (session(None, args.think), None)}
+        prefetcher = prefetch.Prefetcher(budget=args.budget)
+        results["prefetch"] = (session(prefetcher, args.think), prefetcher)
+        prefetcher.close()
+    for name, (latencies, prefetcher) in results.items():
+        line = (f"{name:<12} clicks={len(latencies)} p50_ms={statistics.median(latencies) * 1000:7.1f} "
+                f"mean_ms={statistics.mean(latencies) * 1000:7.1f} max_ms={max(latencies) * 1000:7.1f}")
+        if prefetcher is not None:
+            stats = prefetcher.stats()
+            line += (f" hit_rate={stats['hit_rate']:.2f} fetched={stats['fetched']} wasted={stats['wasted']}"
+                     f" failed={stats['failed']} dropped={stats['dropped']}")
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
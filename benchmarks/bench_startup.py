@@ -0,0 +1,54 @@
+"""Cold-start import time and time-to-window of the GUIs.
+
+Each measurement runs in a fresh interpreter. Time-to-window needs a
+display and is skipped without one. Run from the repository root:
+
+    python3 benchmarks/bench_startup.py --repeat 5
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+IMPORTS = ["nba_analyzer.api", "nba_analyzer.ui", "player_stats", "nba_analyzer_gui"]
+
+TIME_TO_WINDOW = """
+import time
+start = time.perf_counter()
+from nba_analyzer.ui import MainApplication
+app = MainApplication()
+app.update()
+print(time.perf_counter() - start)
+app.destroy()
+"""
+
+
+def measure(code: str, repeat: int) -> float:
+    """Returns the median of the seconds printed by `code` across fresh interpreters."""
+    samples = []
+    for _ in range(repeat):
+        out = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True)
+        samples.append(float(out.stdout.strip().splitlines()[-1]))
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    for module in IMPORTS:
+        code = f"import time\nstart = time.perf_counter()\nimport {module}\nprint(time.perf_counter() - start)"
+        print(f"import {module}: {measure(code, args.repeat) * 1000:.0f} ms")
+    if os.environ.get("DISPLAY") or sys.platform in ("win32", "darwin"):
+        print(f"time-to-window MainApplication: {measure(TIME_TO_WINDOW, args.repeat) * 1000:.0f} ms")
+    else:
+        print("time-to-window: skipped (no display)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""Time-to-first-paint and scroll latency of DataDisplayFrame on a large table.
+
+Requires a display. Run from the repository root:
+
+    python3 benchmarks/bench_table.py --rows 50000
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+import tkinter as tk
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from nba_analyzer.ui import DataDisplayFrame
+
+
+def make_frame(rows: int) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    return pd.DataFrame({
+        "GAME_DATE": pd.date_range("2000-01-01", periods=rows, freq="h").strftime("%b %d, %Y"),
+        "MATCHUP": rng.choice(["LAL vs. BOS", "LAL @ MIA", "GSW vs. DEN"], rows),
+        "WL": rng.choice(["W", "L"], rows),
+        **{col: rng.integers(0, 40, rows) for col in ["PTS", "REB", "AST", "STL", "BLK", "FGM", "FGA"]},
+        "FG_PCT": rng.random(rows).round(3),
+    })
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=50_000)
+    parser.add_argument("--scrolls", type=int, default=200)
+    args = parser.parse_args()
+
+    df = make_frame(args.rows)
+    root = tk.Tk()
+    root.geometry("1200x700")
+    table = DataDisplayFrame(root)
+    table.pack(fill=tk.BOTH, expand=True)
+    root.update()
+
+    start = time.perf_counter()
+    table.update_data(df)
+    root.update_idletasks()
+    first_paint = time.perf_counter() - start
+
+    latencies = []
+    for fraction in np.linspace(0, 1, args.scrolls):
+        start = time.perf_counter()
+        table.yview("moveto", fraction)
+        root.update_idletasks()
+        latencies.append(time.perf_counter() - start)
+    root.destroy()
+
+    latencies.sort()
+    print(f"rows={args.rows} first_paint_ms={first_paint * 1000:.1f} "
+          f"scroll_p50_ms={statistics.median(latencies) * 1000:.2f} "
+          f"scroll_p95_ms={latencies[int(len(latencies) * 0.95) - 1] * 1000:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""Connections opened and per-request latency: nba_api's default HTTP path vs the pooled session.
+
+Serves the benchmark suite's fixtures over local HTTPS (self-signed
+certificate, made with the openssl command) from a FakeStatsServer, then
+runs the same sequential and concurrent uncached fetches through both
+transports. Run from the repository root:
+
+    python3 benchmarks/bench_transport.py --latency 0.01
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from nba_analyzer import api, fixtures, telemetry, transport
+
+from suite import PLAYER_IDS, SEASONS, prepare_fixtures
+
+
+def self_signed_cert(directory: str) -> str:
+    """Writes a localhost certificate and key to one PEM file and returns its path."""
+    path = os.path.join(directory, "localhost.pem")
+    subprocess.run(["openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes", "-days", "1", "-subj", "/CN=127.0.0.1",
+                    "-addext", "subjectAltName=IP:127.0.0.1", "-keyout", path, "-out", path],
+                   check=True, capture_output=True)
+    return path
+
+
+def run(server, http, workers: int) -> dict:
+    """Fetches every fixture once sequentially and once concurrently through `http`."""
+    api.set_transport(http)
+    telemetry.reset()
+    opened = server.connections
+    start = time.perf_counter()
+    for player_id in PLAYER_IDS:
+        for season in SEASONS:
+            api.get_player_game_log(player_id, season)
+    sequential = time.perf_counter() - start
+    start = time.perf_counter()
+    api.get_player_game_logs(PLAYER_IDS, SEASONS, max_workers=workers)
+    concurrent = time.perf_counter() - start
+    requests = telemetry.summary()["api.request"]
+    return {"connections": server.connections - opened, "requests": requests["count"],
+            "p50_ms": requests["p50_ms"], "p95_ms": requests["p95_ms"],
+            "sequential_s": sequential, "concurrent_s": concurrent}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--fixtures", default=os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures"))
+    parser.add_argument("--latency", type=float, default=0.01, help="Seconds the fake server waits per request.")
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    prepare_fixtures(args.fixtures)
+    api.set_cache(None)
+    api.set_warehouse(None)
+    api.set_rate_limit(1000, 1000)
+    with tempfile.TemporaryDirectory() as d:
+        cert = self_signed_cert(d)
+        # nba_api's requests.get() trusts the certificate through the environment.
+        os.environ["REQUESTS_CA_BUNDLE"] = cert
+        with fixtures.FakeStatsServer(args.fixtures, latency=args.latency, certfile=cert) as server:
+            results = {
+                "nba_api": run(server, server.transport(), args.workers),
+                "pooled_session": run(server, transport.SessionTransport(base_url=server.base_url, verify=cert),
+                                      args.workers),
+            }
+    for name, r in results.items():
+        print(f"{name:<15} connections={r['connections']:3d} requests={r['requests']:3d} "
+              f"p50_ms={r['p50_ms']:7.2f} p95_ms={r['p95_ms']:7.2f} "
+              f"sequential_s={r['sequential_s']:.3f} concurrent_s={r['concurrent_s']:.3f}")
+
+
+if __name__ == "__main__":
+    main()
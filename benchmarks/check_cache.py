@@ -0,0 +1,93 @@
+"""Offline check of the response cache's expiry and eviction, through api.
+
+Replays fixtures with a FixtureTransport and counts the requests that reach
+it: current-season responses must be refetched once their TTL passes while
+completed seasons stay cached, and a cache too small for every response must
+evict the least recently used one first. Exits non-zero on failure. Also run
+at the start of suite.py. Run from the repository root:
+
+    python3 benchmarks/check_cache.py
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from nba_analyzer import analysis, api, cache, fixtures
+
+from suite import DEFAULT_FIXTURES, PLAYER_IDS, SEASONS, prepare_fixtures
+
+TTL = 0.2
+
+
+def check_expiry(transport, directory: str):
+    """A current-season response is refetched after its TTL; a completed season's is not."""
+    current, completed = SEASONS[-1], SEASONS[0]
+    player_id = PLAYER_IDS[0]
+    api.set_cache(cache.ResponseCache(os.path.join(directory, "expiry.sqlite3")))
+    current_season, ttl = analysis.current_season, cache.CURRENT_SEASON_TTL
+    analysis.current_season, cache.CURRENT_SEASON_TTL = (lambda: current), TTL
+    try:
+        for season in (current, completed):
+            api.get_player_game_log(player_id, season)
+        sent = transport.requests
+        for season in (current, completed):
+            api.get_player_game_log(player_id, season)
+        assert transport.requests == sent, "a fresh cached response was refetched"
+        time.sleep(TTL * 1.5)
+        api.get_player_game_log(player_id, current)
+        assert transport.requests == sent + 1, "an expired current-season response was not refetched"
+        api.get_player_game_log(player_id, completed)
+        assert transport.requests == sent + 1, "a completed season's response expired"
+    finally:
+        analysis.current_season, cache.CURRENT_SEASON_TTL = current_season, ttl
+        api.get_cache().close()
+
+def check_eviction(transport, directory: str):
+    """With room for two responses, storing a third evicts the least recently used."""
+    season = SEASONS[0]
+    first, second, third = PLAYER_IDS[:3]
+    probe = cache.ResponseCache(os.path.join(directory, "probe.sqlite3"))
+    api.set_cache(probe)
+    sizes = []
+    for player_id in (first, second, third):
+        before = probe.size()
+        api.get_player_game_log(player_id, season)
+        sizes.append(probe.size() - before)
+    probe.close()
+
+    api.set_cache(cache.ResponseCache(os.path.join(directory, "lru.sqlite3"), max_bytes=int(max(sizes) * 2.5)))
+    try:
+        api.get_player_game_log(first, season)
+        time.sleep(0.01)
+        api.get_player_game_log(second, season)
+        time.sleep(0.01)
+        api.get_player_game_log(first, season)  # Now the second is least recently used.
+        time.sleep(0.01)
+        api.get_player_game_log(third, season)
+        sent = transport.requests
+        api.get_player_game_log(first, season)
+        assert transport.requests == sent, "the most recently used response was evicted"
+        api.get_player_game_log(second, season)
+        assert transport.requests == sent + 1, "the least recently used response was not evicted"
+        assert api.get_cache().size() <= api.get_cache().max_bytes, "the cache grew past max_bytes"
+    finally:
+        api.get_cache().close()
+
+def run(fixture_dir: str = DEFAULT_FIXTURES):
+    prepare_fixtures(fixture_dir)
+    transport = fixtures.FixtureTransport(fixture_dir)
+    api.set_transport(transport)
+    api.set_warehouse(None)
+    api.set_rate_limit(1000, 1000)
+    with tempfile.TemporaryDirectory() as d:
+        check_expiry(transport, d)
+        check_eviction(transport, d)
+    api.set_cache(None)
+
+
+if __name__ == "__main__":
+    run()
+    print("cache expiry and eviction OK")
@@ -0,0 +1,39 @@
+"""Offline check that the CLI reports an unreachable stats server as an error.
+
+Points api at a SessionTransport for a closed local port, with the cache and
+warehouse off, and runs `team` and a single-season `leaders` through
+cli.main: each must print an error and return 1 instead of raising. Exits
+non-zero on failure. Also run at the start of suite.py. Run from the
+repository root:
+
+    python3 benchmarks/check_cli.py
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from nba_analyzer import api, cli, transport
+
+UNREACHABLE = "http://127.0.0.1:1/stats/{endpoint}"
+COMMANDS = (["team", "LAL"], ["leaders", "2018-19"])
+
+
+def run():
+    previous = api.get_transport()
+    api.set_transport(transport.SessionTransport(base_url=UNREACHABLE, retries=0, connect_timeout=0.5))
+    api.set_cache(None)
+    api.set_warehouse(None)
+    try:
+        for argv in COMMANDS:
+            with cli.console.capture() as captured:
+                status = cli.main(argv)
+            assert status == 1, f"{' '.join(argv)} returned {status} while offline"
+            assert "Error:" in captured.get(), f"{' '.join(argv)} printed no error while offline"
+    finally:
+        api.set_transport(previous)
+
+
+if __name__ == "__main__":
+    run()
+    print("offline CLI errors OK")
@@ -0,0 +1,255 @@
+"""Offline benchmark suite: API lookups, bulk fetches, name resolution, game-log
+processing and Treeview population, against a stored baseline.
+
+Endpoint calls are answered by a local FakeStatsServer replaying fixtures from
+--fixtures with --latency seconds per request, so results do not depend on
+stats.nba.com. Record real responses once with --record (needs network);
+without recorded fixtures, deterministic synthetic ones shaped like
+PlayerGameLog responses are generated into the fixture directory, and the
+results are labelled as such.
+
+Run from the repository root:
+
+    python3 benchmarks/suite.py --output results.json
+    python3 benchmarks/suite.py --save-baseline              # store benchmarks/baseline.json
+    python3 benchmarks/suite.py --baseline benchmarks/baseline.json --tolerance 0.25
+
+Timings depend on the machine, so no baseline is committed: save one locally
+before comparing. Fixtures and the baseline are ignored by git.
+
+With --baseline, any case whose median is more than --tolerance slower than
+the baseline is reported and the exit status is 1.
+"""
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from nba_api.stats.endpoints import playergamelog
+from nba_api.stats.library.http import NBAStatsHTTP
+
+from bench_gamelog import make_log
+from nba_analyzer import analysis, api, cache, fixtures, names
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_FIXTURES = os.path.join(HERE, "fixtures")
+DEFAULT_BASELINE = os.path.join(HERE, "baseline.json")
+SYNTHETIC_MARKER = "SYNTHETIC"
+# The fake server answers every Nth request with 429 in the throttled bulk case.
+THROTTLE_EVERY = 4
+
+# LeBron James, Stephen Curry, Kevin Durant, Giannis Antetokounmpo, Nikola Jokic
+PLAYER_IDS = [2544, 201939, 201142, 203507, 203999]
+SEASONS = ["2018-19", "2019-20", "2020-21", "2021-22", "2022-23"]
+NAME_QUERIES = ["LeBron James", "lebron", "Stephen Curry", "Curry", "Giannis", "Nikola Jokic",
+                "Jokic", "Kevin Durant", "Lebron Jmaes", "Stph Curry", "Kareem", "Michael Jordan"]
+GAMELOG_ROWS = [1_000, 100_000, 1_000_000]
+TABLE_ROWS = [1_000, 50_000]
+
+
+def _parameters(player_id: int, season: str) -> tuple[str, dict]:
+    endpoint = playergamelog.PlayerGameLog(player_id=player_id, season=season, get_request=False)
+    return endpoint.endpoint, endpoint.parameters
+
+def prepare_fixtures(directory: str, record: bool = False) -> str:
+    """Makes sure every request the suite issues has a fixture. Returns 'recorded' or 'synthetic'."""
+    marker = os.path.join(directory, SYNTHETIC_MARKER)
+    if record and os.path.exists(marker):
+        shutil.rmtree(directory)
+    transport = fixtures.FixtureTransport(directory, record_from=NBAStatsHTTP() if record else None)
+    headers = playergamelog.PlayerGameLog.expected_data["PlayerGameLog"]
+    for player_id in PLAYER_IDS:
+        for season in SEASONS:
+            endpoint, parameters = _parameters(player_id, season)
+            path = transport.fixture_path(endpoint, parameters)
+            if record:
+                transport.send_api_request(endpoint, parameters)
+            elif not os.path.exists(path):
+                log = make_log(82).assign(Player_ID=player_id, SEASON_ID="2" + season[:4])
+                log = log.reindex(columns=headers, fill_value=0)
+                body = {"resultSets": [{"name": "PlayerGameLog", "headers": headers,
+                                        "rowSet": log.to_numpy(dtype=object).tolist()}]}
+                with open(path, "w", encoding="utf-8") as f:
+                    json.dump(body, f, default=int)
+                open(marker, "w").close()
+    return "synthetic" if os.path.exists(marker) else "recorded"
+
+def measure(func, repeat: int) -> dict:
+    """Runs func `repeat` times and summarizes the timings."""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - start)
+    return {"median_s": statistics.median(samples), "min_s": min(samples), "samples": samples}
+
+
+def bench_api(server, repeat: int) -> dict:
+    results = {}
+    api.set_transport(server.transport())
+    api.set_warehouse(None)
+    api.set_rate_limit(1000, 1000)  # Measure the fetch path, not the politeness throttle.
+    player_id, season = PLAYER_IDS[0], SEASONS[0]
+
+    api.set_cache(None)
+    results["single_lookup_uncached"] = measure(lambda: api.get_player_game_log(player_id, season), repeat)
+
+    with tempfile.TemporaryDirectory() as d:
+        response_cache = cache.ResponseCache(os.path.join(d, "cache.sqlite3"))
+        api.set_cache(response_cache)
+        api.get_player_game_log(player_id, season)
+        results["single_lookup_cached"] = measure(lambda: api.get_player_game_log(player_id, season), repeat)
+        response_cache.close()
+
+    api.set_cache(None)
+    results[f"bulk_fetch_{len(PLAYER_IDS)}x{len(SEASONS)}"] = measure(
+        lambda: api.get_player_game_logs(PLAYER_IDS, SEASONS, max_workers=4), repeat)
+    return results
+
+def bench_throttled(server, repeat: int) -> dict:
+    """Bulk fetch while the server rate limits; fails unless every job recovers through the 429 retry path."""
+    api.set_transport(server.transport())
+    api.set_warehouse(None)
+    api.set_cache(None)
+    api.set_rate_limit(1000, 1000, cooldown=0.05)
+    jobs = [(player_id, season) for player_id in PLAYER_IDS for season in SEASONS]
+
+    def fetch_all():
+        results = api.fetch_concurrently(api.get_player_game_log, jobs, max_workers=4)
+        if len(results) != len(jobs):
+            raise RuntimeError(f"Only {len(results)} of {len(jobs)} jobs survived rate limiting")
+
+    result = measure(fetch_all, repeat)
+    if not server.throttled:
+        raise RuntimeError("The fake server never answered 429")
+    result["throttled"] = server.throttled
+    return {f"bulk_fetch_{len(PLAYER_IDS)}x{len(SEASONS)}_throttled": result}
+
+def bench_names(repeat: int) -> dict:
+    entries = api.get_all_players()
+    index = names.NameIndex(entries)
+    return {
+        "name_index_build": measure(lambda: names.NameIndex(entries), repeat),
+        f"name_resolution_{len(NAME_QUERIES)}": measure(lambda: [index.find(q, fuzzy=True) for q in NAME_QUERIES],
+                                                        repeat),
+    }
+
+def bench_gamelog(repeat: int, sizes) -> dict:
+    results = {}
+    for rows in sizes:
+        df = make_log(rows)
+        results[f"process_gamelog_{rows}"] = measure(lambda: analysis.process_player_gamelog(df), repeat)
+    return results
+
+def bench_table(repeat: int, sizes) -> dict:
+    """Time from update_data() to a painted Treeview. Skipped without a display."""
+    import tkinter as tk
+    from bench_table import make_frame
+    from nba_analyzer.ui import DataDisplayFrame
+
+    try:
+        root = tk.Tk()
+    except tk.TclError as e:
+        print(f"Skipping Treeview population: {e}", file=sys.stderr)
+        return {}
+    root.geometry("1200x700")
+    table = DataDisplayFrame(root)
+    table.pack(fill=tk.BOTH, expand=True)
+    root.update()
+
+    def populate(df):
+        table.update_data(df)
+        while table._pending is not None:  # Drain chunked inserts.
+            root.update()
+        root.update_idletasks()
+
+    results = {}
+    for rows in sizes:
+        df = make_frame(rows)
+        results[f"treeview_populate_{rows}"] = measure(lambda: populate(df), repeat)
+    root.destroy()
+    return results
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list[str]:
+    """Returns a description of every case more than `tolerance` slower than the baseline."""
+    regressions = []
+    for case, result in results.items():
+        base = baseline.get("results", {}).get(case)
+        if base and result["median_s"] > base["median_s"] * (1 + tolerance):
+            regressions.append(f"{case}: {result['median_s'] * 1000:.2f} ms vs baseline "
+                               f"{base['median_s'] * 1000:.2f} ms "
+                               f"(+{result['median_s'] / base['median_s'] - 1:.0%})")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--fixtures", default=DEFAULT_FIXTURES, help="Directory of recorded responses.")
+    parser.add_argument("--record", action="store_true", help="Record fixtures from stats.nba.com first.")
+    parser.add_argument("--latency", type=float, default=0.05, help="Seconds the fake server waits per request.")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--rows", type=int, nargs="+", default=GAMELOG_ROWS, help="Game-log sizes to process.")
+    parser.add_argument("--table-rows", type=int, nargs="+", default=TABLE_ROWS)
+    parser.add_argument("--output", "-o", help="Write results as JSON to this file.")
+    parser.add_argument("--baseline", help="Compare against a results file and flag regressions.")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed slowdown before flagging.")
+    parser.add_argument("--save-baseline", nargs="?", const=DEFAULT_BASELINE, metavar="PATH",
+                        help=f"Store these results as the baseline (default {DEFAULT_BASELINE}).")
+    args = parser.parse_args()
+
+    if args.baseline and not os.path.exists(args.baseline):
+        parser.error(f"no baseline at {args.baseline}; create one on this machine first with --save-baseline")
+    fixture_source = prepare_fixtures(args.fixtures, args.record)
+    import check_cache, check_cli  # check_cache imports this module, so not at the top.
+    check_cache.run(args.fixtures)
+    check_cli.run()
+    results = {}
+    with fixtures.FakeStatsServer(args.fixtures, latency=args.latency) as server:
+        results.update(bench_api(server, args.repeat))
+    with fixtures.FakeStatsServer(args.fixtures, latency=args.latency, throttle_every=THROTTLE_EVERY) as server:
+        results.update(bench_throttled(server, args.repeat))
+    results.update(bench_names(args.repeat))
+    results.update(bench_gamelog(args.repeat, args.rows))
+    results.update(bench_table(args.repeat, args.table_rows))
+
+    report = {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "numpy": np.__version__,
+            "fixtures": fixture_source,
+            "latency_s": args.latency,
+            "repeat": args.repeat,
+        },
+        "results": results,
+    }
+    print(f"fixtures={fixture_source} latency_s={args.latency} repeat={args.repeat}")
+    for case, result in results.items():
+        print(f"{case:<32} median_ms={result['median_s'] * 1000:10.2f} min_ms={result['min_s'] * 1000:10.2f}")
+
+    for path in filter(None, [args.output, args.save_baseline]):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
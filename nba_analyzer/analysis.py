@@ -1,7 +1,19 @@
 """Data analysis and manipulation functions."""
 
+from __future__ import annotations
+
 from datetime import datetime
-import pandas as pd
+from . import telemetry
+from .lazy import lazy_import
+
+np = lazy_import("numpy")
+pd = lazy_import("pandas")
+
+# MATCHUP looks like 'BOS vs. PHI' (home) or 'BOS @ MIA' (away).
+MATCHUP_PATTERN = r"^(?P<TEAM_ABBREVIATION>\w+) (?P<SEPARATOR>vs\.|@) (?P<OPPONENT>\w+)$"
+GAME_DATE_FORMAT = "%b %d, %Y"
+# String columns with at most this many distinct values per row are stored as categoricals.
+CATEGORY_RATIO = 0.5
 
 
 def get_team_win_loss_trend(stats_df: pd.DataFrame) -> pd.DataFrame:
@@ -9,19 +21,103 @@ def get_team_win_loss_trend(stats_df: pd.DataFrame) -> pd.DataFrame:
     # This is a placeholder for your analysis logic.
     return stats_df[["YEAR", "WINS", "LOSSES", "WIN_PCT"]]
 
+def player_trends(game_log: pd.DataFrame, window: int = 10) -> pd.DataFrame:
+    """
+    Returns rolling last-`window`-game points per game and FG/3P/FT percentages
+    (made over attempted across the window), oldest game first.
+    """
+    games = game_log.sort_values("GAME_DATE", kind="stable")
+    trends = {"GAME_DATE": games["GAME_DATE"].to_numpy()}
+    if "PTS" in games.columns:
+        trends[f"PTS_LAST{window}"] = games["PTS"].astype("float64").rolling(window, min_periods=1).mean().to_numpy()
+    for pct, made, attempted in (("FG_PCT", "FGM", "FGA"), ("FG3_PCT", "FG3M", "FG3A"), ("FT_PCT", "FTM", "FTA")):
+        if {made, attempted} <= set(games.columns):
+            made_sum = games[made].astype("float64").rolling(window, min_periods=1).sum()
+            attempted_sum = games[attempted].astype("float64").rolling(window, min_periods=1).sum()
+            trends[f"{pct}_LAST{window}"] = (made_sum / attempted_sum.where(attempted_sum > 0)).to_numpy()
+    return pd.DataFrame(trends)
+
+def _unique_values(series: pd.Series) -> tuple[np.ndarray, pd.Series]:
+    """Factorizes a column so per-value work only runs once per distinct value."""
+    codes, uniques = pd.factorize(series)
+    return codes, pd.Series(uniques)
+
+def _take(codes: np.ndarray, values: pd.Series, categorical: bool = False):
+    """Broadcasts per-unique values back to every row; code -1 (missing) becomes NA."""
+    if categorical:
+        cat = pd.Categorical(values)
+        return pd.Categorical.from_codes(np.where(codes >= 0, cat.codes[codes], -1), categories=cat.categories)
+    # Index -1 picks the appended NA.
+    padded = pd.concat([values, pd.Series([None], dtype=values.dtype)], ignore_index=True)
+    return padded.to_numpy()[codes]
+
+def _parse_minutes(values: pd.Series) -> pd.Series:
+    """Converts MIN values such as 34, '34' or '34:12' to float minutes."""
+    parts = values.astype(str).str.extract(r"^(\d+)(?::(\d+))?")
+    return parts[0].astype(float) + parts[1].astype(float).fillna(0) / 60
+
+def downcast_numeric(df: pd.DataFrame) -> pd.DataFrame:
+    """Downcasts integer and float columns to the smallest dtype that holds their values."""
+    for col in df.select_dtypes(include="integer").columns:
+        df[col] = pd.to_numeric(df[col], downcast="integer")
+    for col in df.select_dtypes(include="float").columns:
+        df[col] = pd.to_numeric(df[col], downcast="float")
+    return df
+
+def _parse_game_dates(values: pd.Series):
+    """Parses API dates such as 'APR 13, 2016' once per distinct date."""
+    codes, dates = _unique_values(values)
+    return _take(codes, pd.to_datetime(dates, format=GAME_DATE_FORMAT, errors='coerce'))
+
+def compact(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Shrinks a frame from the API in place: GAME_DATE becomes datetime64, repeated
+    strings (MATCHUP, WL, SEASON_ID, team names, ...) become categoricals and
+    numeric columns are downcast. Returns the frame.
+    """
+    if 'GAME_DATE' in df.columns and df['GAME_DATE'].dtype == object:
+        df['GAME_DATE'] = _parse_game_dates(df['GAME_DATE'])
+    for col in df.select_dtypes(include="object").columns:
+        if df[col].nunique() <= len(df) * CATEGORY_RATIO:
+            df[col] = df[col].astype("category")
+    return downcast_numeric(df)
+
+@telemetry.timed("analysis.process_player_gamelog")
 def process_player_gamelog(stats_df: pd.DataFrame) -> pd.DataFrame:
     """
-    Adds a GAME_LOCATION column to the player game log DataFrame.
-    The MATCHUP column is like 'BOS vs. PHI' (home) or 'BOS @ MIA' (away).
+    Derives LOCATION ('Home'/'Away'), TEAM_ABBREVIATION and OPPONENT from MATCHUP,
+    parses GAME_DATE to datetime64, converts MIN to numbers and downcasts numeric columns.
+    Repeated strings are parsed once per distinct value and stored as categoricals,
+    so this stays fast on concatenated multi-season or league-wide logs.
     """
-    if 'MATCHUP' in stats_df.columns:
-        stats_df['LOCATION'] = stats_df['MATCHUP'].apply(lambda x: 'Home' if 'vs.' in x else 'Away')
-    return stats_df
+    df = stats_df.copy()
+    if 'MATCHUP' in df.columns:
+        codes, matchups = _unique_values(df['MATCHUP'])
+        parts = matchups.astype(str).str.extract(MATCHUP_PATTERN)
+        location = parts['SEPARATOR'].map({'vs.': 'Home'}).fillna('Away')
+        df['LOCATION'] = pd.Categorical(_take(codes, location, categorical=True), categories=['Home', 'Away'])
+        df['TEAM_ABBREVIATION'] = _take(codes, parts['TEAM_ABBREVIATION'], categorical=True)
+        df['OPPONENT'] = _take(codes, parts['OPPONENT'], categorical=True)
+    if 'GAME_DATE' in df.columns and not pd.api.types.is_datetime64_any_dtype(df['GAME_DATE']):
+        df['GAME_DATE'] = _parse_game_dates(df['GAME_DATE'])
+    if 'MIN' in df.columns and not pd.api.types.is_numeric_dtype(df['MIN']):
+        codes, minutes = _unique_values(df['MIN'])
+        df['MIN'] = _take(codes, _parse_minutes(minutes))
+    return downcast_numeric(df)
+
+def current_season() -> str:
+    """Returns the current (or most recent) season string, e.g. '2024-25'."""
+    now = datetime.now()
+    # If it's before October, the current season is the previous year's
+    start_year = now.year - 1 if now.month < 10 else now.year
+    return f"{start_year}-{str(start_year + 1)[-2:]}"
+
+def season_end(season: str) -> datetime:
+    """Returns when `season` stops being the current season (see current_season)."""
+    return datetime(int(season[:4]) + 1, 10, 1)
 
 def generate_seasons_list() -> list[str]:
     """Generates a list of seasons from 1996-97 to the current season."""
-    current_year = datetime.now().year
-    # If it's before October, the current season is the previous year's
-    start_year = current_year -1 if datetime.now().month < 10 else current_year
+    start_year = int(current_season()[:4])
     seasons = [f"{year}-{str(year+1)[-2:]}" for year in range(1996, start_year + 1)]
     return sorted(seasons, reverse=True)
\ No newline at end of file
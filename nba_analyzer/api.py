@@ -1,56 +1,309 @@
 """Functions for interacting with the NBA API."""
 
-from nba_api.stats.static import teams, players
-from nba_api.stats.endpoints import teamyearbyyearstats, playergamelog
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from functools import lru_cache
+import logging
+import threading
+from . import analysis, cache, names, registry, singleflight, telemetry, throttle, transport, warehouse
+from .lazy import lazy_import
+
+# Heavy imports are deferred until the first endpoint call.
+endpoints = lazy_import("nba_api.stats.endpoints")
+stats_http = lazy_import("nba_api.stats.library.http")
+pd = lazy_import("pandas")
+
+logger = logging.getLogger(__name__)
+
+_UNSET = object()
+_response_cache = _UNSET
+_transport = None
+_warehouse = _UNSET
+# Shared across every thread so bulk fetches stay under stats.nba.com throttling.
+_rate_limiter = throttle.TokenBucket(rate=2.0, capacity=4)
+# Seconds every thread holds off after a 429.
+_rate_limit_cooldown = 5.0
+# Identical requests in flight at the same time share one upstream call.
+_in_flight = singleflight.SingleFlight()
+_cache_hits = 0
+_stats_lock = threading.Lock()
 
 
 @lru_cache(maxsize=1)
-def get_all_teams():
+def get_all_teams() -> list[registry.Team]:
     """Fetches all NBA teams.
     
     Uses caching to avoid repeated API calls.
     """
-    return teams.get_teams()
+    return registry.load_teams()
 
 @lru_cache(maxsize=1)
-def get_all_players():
+def get_all_players() -> list[registry.Player]:
     """Fetches all players."""
-    return players.get_players()
+    return registry.load_players()
 
 @lru_cache(maxsize=1)
-def get_active_players():
+def get_active_players() -> list[registry.Player]:
     """Fetches all active NBA players."""
-    return players.get_active_players()
+    return [p for p in get_all_players() if p.is_active]
+
+@lru_cache(maxsize=1)
+def player_index() -> names.NameIndex:
+    """Builds the name index over all players once and reuses it."""
+    return names.NameIndex(get_all_players())
+
+@lru_cache(maxsize=1)
+def team_index() -> names.NameIndex:
+    """Builds the name index over all teams (full name, abbreviation, nickname) once."""
+    return names.NameIndex(get_all_teams(), fields=("full_name", "abbreviation", "nickname"))
 
 def get_team_id(team_name: str) -> int:
     """Gets the ID for a given team name."""
-    team_list = get_all_teams()
-    team_info = [t for t in team_list if t["full_name"] == team_name]
+    team_info = team_index().exact(team_name)
     if not team_info:
         raise ValueError(f"Team '{team_name}' not found.")
-    return team_info[0]["id"]
+    return team_info["id"]
 
 def find_player(player_name: str) -> dict:
-    """Find a player's info by their full name."""
-    player_info = players.find_players_by_full_name(player_name)
+    """Find a player's info by their full name (or part of it), preferring active players."""
+    player_info = player_index().find(player_name)
     if not player_info:
         raise ValueError(f"Player '{player_name}' not found.")
-    return player_info[0]
+    return player_info
+
+
+def set_cache(response_cache: cache.ResponseCache | None):
+    """Replaces the response cache used for endpoint calls. Pass None to disable caching."""
+    global _response_cache
+    _response_cache = response_cache
+
+def get_cache() -> cache.ResponseCache | None:
+    """Returns the active response cache, creating the default on-disk cache on first use."""
+    global _response_cache
+    if _response_cache is _UNSET:
+        _response_cache = cache.ResponseCache()
+    return _response_cache
+
+def set_warehouse(store: warehouse.Warehouse | None):
+    """Replaces the local columnar store fetched frames are written to. Pass None to disable it."""
+    global _warehouse
+    _warehouse = store
+
+def get_warehouse() -> warehouse.Warehouse | None:
+    """Returns the active warehouse, defaulting to the on-disk one."""
+    global _warehouse
+    if _warehouse is _UNSET:
+        _warehouse = warehouse.get_warehouse()
+    return _warehouse
+
+def set_transport(http):
+    """Replaces the HTTP layer used for endpoint calls, e.g. with a fixtures.FixtureTransport
+    or a transport.SessionTransport with custom timeouts, retries or proxies.
+
+    Pass None to restore the default pooled session.
+    """
+    global _transport
+    _transport = http
+
+def get_transport():
+    """Returns the active HTTP layer, creating the shared pooled session on first use."""
+    global _transport
+    if _transport is None:
+        _transport = transport.SessionTransport()
+    return _transport
+
+def set_rate_limit(rate: float, burst: int = 1, cooldown: float = 5.0):
+    """
+    Sets the maximum sustained rate (requests per second) of uncached endpoint calls, and
+    how long all of them pause after stats.nba.com answers 429.
+    """
+    global _rate_limiter, _rate_limit_cooldown
+    _rate_limiter = throttle.TokenBucket(rate=rate, capacity=burst)
+    _rate_limit_cooldown = cooldown
+
+def fetch_stats() -> dict:
+    """
+    Returns counts of endpoint calls answered from the response cache (hits), sent
+    upstream (misses) and served by joining an identical in-flight request (coalesced).
+    """
+    return {"hits": _cache_hits, "misses": _in_flight.calls, "coalesced": _in_flight.coalesced}
 
+def _request(endpoint, key: str, response_cache) -> tuple[str, bool]:
+    """
+    Sends one endpoint request upstream and caches the body. Returns (body, sent), where `sent`
+    is False if an identical request had meanwhile filled the cache and nothing was sent.
+    """
+    # An identical request may have finished between our cache lookup and now.
+    body = response_cache.get(key) if response_cache is not None else None
+    if body is not None:
+        return body, False
+    _rate_limiter.acquire()
+    with telemetry.span("api.request", endpoint=endpoint.endpoint) as request_span:
+        try:
+            response = get_transport().send_api_request(
+                endpoint=endpoint.endpoint,
+                parameters=endpoint.parameters,
+                proxy=endpoint.proxy,
+                headers=endpoint.headers,
+                timeout=endpoint.timeout,
+            )
+        except ConnectionError:
+            raise
+        except OSError as e:
+            # requests' ConnectionError and Timeout aren't the builtin ConnectionError callers catch.
+            raise ConnectionError(f"Request to {endpoint.endpoint} failed: {e}") from e
+        request_span["status"] = response._status_code
+    if response._status_code == 429:
+        # Slow every thread down, not just this one.
+        _rate_limiter.pause(_rate_limit_cooldown)
+        raise throttle.RateLimitedError(f"Rate limited by {endpoint.endpoint}")
+    if not 200 <= response._status_code < 300:
+        raise ConnectionError(f"{endpoint.endpoint} answered HTTP {response._status_code}")
+    # Error pages can be valid JSON too; only bodies holding result sets are cached.
+    try:
+        response.get_data_sets()
+    except (ValueError, KeyError, TypeError) as e:
+        raise ConnectionError(f"Invalid response from {endpoint.endpoint}: {e!r}") from e
+    body = response.get_response()
+    if response_cache is not None:
+        response_cache.set(key, endpoint.endpoint, endpoint.parameters, body, cache.ttl_for(endpoint.parameters))
+    return body, True
+
+def _fetch(endpoint_cls, **kwargs) -> tuple[list, bool]:
+    """
+    Calls an nba_api endpoint through the response cache. Returns its DataFrames, compacted
+    with analysis.compact, and whether this call fetched them upstream (False for cache hits
+    and for calls that joined an identical in-flight request).
+    """
+    global _cache_hits
+    endpoint = endpoint_cls(get_request=False, **kwargs)
+    with telemetry.span("api.fetch", endpoint=endpoint.endpoint) as fetch_span:
+        response_cache = get_cache()
+        key = cache.make_key(endpoint.endpoint, endpoint.parameters)
+        body = response_cache.get(key) if response_cache is not None else None
+        fresh = False
+        if body is not None:
+            fetch_span["cache"] = "hit"
+            with _stats_lock:
+                _cache_hits += 1
+        else:
+            (body, sent), shared = _in_flight.do(key, lambda: _request(endpoint, key, response_cache))
+            fresh = sent and not shared
+            fetch_span["cache"] = "coalesced" if shared else "miss" if sent else "hit"
+        fetch_span["bytes"] = len(body)
+        # Each caller parses its own copy, so frames are never shared between callers.
+        with telemetry.span("api.parse", endpoint=endpoint.endpoint) as parse_span:
+            endpoint.nba_response = stats_http.NBAStatsResponse(response=body, status_code=200, url=None)
+            endpoint.load_response()
+            frames = [analysis.compact(df) for df in endpoint.get_data_frames()]
+            parse_span["rows"] = fetch_span["rows"] = sum(len(df) for df in frames)
+    return frames, fresh
+
+def _stored_complete(store, dataset: str, season: str, name) -> bool:
+    """
+    Returns True if the warehouse holds the finished `season` for `name`. Files written while
+    the season was still current are partial snapshots and don't count.
+    """
+    return store is not None and season != analysis.current_season() \
+        and store.exists(dataset, season, name, since=analysis.season_end(season))
 
 def get_team_yearly_stats(team_id: int):
     """Fetches year-by-year stats for a given team ID."""
-    stats = teamyearbyyearstats.TeamYearByYearStats(team_id=team_id)
-    return stats.get_data_frames()[0]
+    frames, fresh = _fetch(endpoints.teamyearbyyearstats.TeamYearByYearStats, team_id=team_id)
+    df = frames[0]
+    store = get_warehouse()
+    if store is not None and fresh:
+        store.write(warehouse.TEAM_YEARLY_STATS, team_id, "yearly", df)
+    return df
+
+def get_team_roster(team_id: int, season: str):
+    """Fetches a team's roster for a season, one row per player (PLAYER_ID, PLAYER, POSITION, ...)."""
+    return _fetch(endpoints.commonteamroster.CommonTeamRoster, team_id=team_id, season=season)[0][0]
 
-def get_player_game_log(player_id: int, season: str):
+def get_player_game_log(player_id: int, season: str, date_from: str = ""):
     """
     Fetches the game log for a specific player and season.
-    Returns a pandas DataFrame.
+    `date_from` (MM/DD/YYYY) limits the log to games on or after that date.
+    Completed seasons already in the warehouse are read from it instead.
+    Returns a pandas DataFrame with datetime GAME_DATE and categorical repeated strings.
     """
+    store = get_warehouse()
+    if not date_from and _stored_complete(store, warehouse.PLAYER_GAME_LOGS, season, player_id):
+        df = store.read(warehouse.PLAYER_GAME_LOGS, season, player_id)
+        return analysis.compact(df[endpoints.playergamelog.PlayerGameLog.expected_data["PlayerGameLog"]].copy())
     try:
-        gamelog = playergamelog.PlayerGameLog(player_id=player_id, season=season)
-        return gamelog.get_data_frames()[0]
-    except Exception as e:
-        raise ConnectionError(f"Could not fetch game log for player ID {player_id}: {e}")
\ No newline at end of file
+        frames, fresh = _fetch(endpoints.playergamelog.PlayerGameLog, player_id=player_id, season=season,
+                               date_from_nullable=date_from)
+        df = frames[0]
+    except throttle.RateLimitedError:
+        raise
+    except OSError as e:
+        # Transport failures only; parse errors and bugs surface as themselves.
+        raise ConnectionError(f"Could not fetch game log for player ID {player_id}: {e}")
+    # Written when fetched upstream, or to fill in a finished season missing from the warehouse;
+    # cache hits for the current season were already written when first fetched.
+    if store is not None and not date_from and (fresh or season != analysis.current_season()):
+        # Stored processed, so LOCATION/OPPONENT and real dates can be filtered on.
+        store.write(warehouse.PLAYER_GAME_LOGS, season, player_id, analysis.process_player_gamelog(df))
+    return df
+
+def get_league_leaders(season: str, stat_category: str = "PTS"):
+    """Fetches the league leaders in a stat category for a season."""
+    store = get_warehouse()
+    if _stored_complete(store, warehouse.LEAGUE_LEADERS, season, stat_category):
+        return analysis.compact(store.read(warehouse.LEAGUE_LEADERS, season, stat_category))
+    frames, fresh = _fetch(endpoints.leagueleaders.LeagueLeaders, season=season,
+                           stat_category_abbreviation=stat_category)
+    df = frames[0]
+    if store is not None and (fresh or season != analysis.current_season()):
+        store.write(warehouse.LEAGUE_LEADERS, season, stat_category, df)
+    return df
+
+def iter_concurrently(func, jobs, max_workers: int = 4):
+    """
+    Calls func(*job) for each job tuple over a bounded thread pool, retrying jobs that were
+    rate limited (429) with backoff; connection errors and 5xx responses are retried by the
+    transport. Yields (job, result, error) as each job completes; `error` is the final
+    exception for jobs that still failed, otherwise None.
+    """
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        futures = {executor.submit(throttle.retry, lambda job=job: func(*job), retry_on=(throttle.RateLimitedError,)):
+                   job for job in jobs}
+        for future in as_completed(futures):
+            error = future.exception()
+            yield futures[future], None if error else future.result(), error
+    finally:
+        # If the caller stops early (e.g. Ctrl-C), don't wait for the queued jobs.
+        executor.shutdown(wait=False, cancel_futures=True)
+
+def fetch_concurrently(func, jobs, max_workers: int = 4, progress=None) -> list:
+    """
+    Calls func(*job) for each job tuple concurrently; jobs that still fail after
+    retrying are logged and skipped. `progress`, if given, is called as
+    progress(done, total, *job, error) as each job completes.
+    Returns the results of the successful jobs in completion order.
+    """
+    jobs = list(jobs)
+    results = []
+    for done, (job, result, error) in enumerate(iter_concurrently(func, jobs, max_workers), start=1):
+        if error is None:
+            results.append(result)
+        else:
+            logger.warning("Giving up on %s after retries: %s", job, error)
+        if progress is not None:
+            progress(done, len(jobs), *job, error)
+    return results
+
+def get_player_game_logs(player_ids, seasons, max_workers: int = 4, progress=None) -> pd.DataFrame:
+    """
+    Fetches game logs for every combination of player ID and season concurrently.
+    `progress`, if given, is called as progress(done, total, player_id, season, error)
+    as each request completes. Returns one concatenated pandas DataFrame.
+    """
+    jobs = [(player_id, season) for player_id in player_ids for season in seasons]
+    frames = fetch_concurrently(get_player_game_log, jobs, max_workers, progress)
+    frames = [df for df in frames if not df.empty]
+    # Categories differ between frames, so compact the combined frame again.
+    return analysis.compact(pd.concat(frames, ignore_index=True)) if frames else pd.DataFrame()
@@ -0,0 +1,122 @@
+"""Headless batch scraping with checkpoint/resume.
+
+A job spec is a JSON file describing what to pull::
+
+    {
+        "players": ["LeBron James", 201939],
+        "seasons": {"from": "2003-04", "to": "2023-24"},
+        "teams": "all",
+        "leaders": {"seasons": ["2022-23", "2023-24"], "categories": ["PTS", "REB", "AST"]}
+    }
+
+Players and teams may be names or IDs, and "seasons" may be a list or a
+from/to range. The spec expands into one task per player-season, team and
+leader category-season. Results are appended to one CSV per kind in the
+output directory as each task completes, and the task is then recorded in
+``checkpoint.jsonl``; rerunning the same spec skips recorded tasks, so an
+interrupted scrape resumes where it stopped. A task that completed but was
+not yet checkpointed when the process died is fetched again, so its rows
+may appear twice.
+"""
+
+import json
+import os
+
+from . import analysis, api, leaders
+
+CHECKPOINT_FILE = "checkpoint.jsonl"
+OUTPUT_FILES = {
+    "game_log": "player_game_logs.csv",
+    "team": "team_yearly_stats.csv",
+    "leaders": "league_leaders.csv",
+}
+
+
+def _seasons(spec) -> list[str]:
+    if isinstance(spec, dict):
+        seasons = sorted(analysis.generate_seasons_list())
+        return [s for s in seasons if spec.get("from", seasons[0]) <= s <= spec.get("to", seasons[-1])]
+    return list(spec or [])
+
+def _player_id(player) -> int:
+    return player if isinstance(player, int) else api.find_player(player)["id"]
+
+def _team_id(team) -> int:
+    return team if isinstance(team, int) else api.get_team_id(team)
+
+def load_tasks(spec: dict) -> list[tuple]:
+    """Expands a job spec into (kind, *args) task tuples."""
+    tasks = []
+    seasons = _seasons(spec.get("seasons"))
+    for player in spec.get("players", []):
+        player_id = _player_id(player)
+        tasks.extend(("game_log", player_id, season) for season in seasons)
+    teams = spec.get("teams", [])
+    if teams == "all":
+        teams = [t["id"] for t in api.get_all_teams()]
+    tasks.extend(("team", _team_id(team)) for team in teams)
+    leaders = spec.get("leaders")
+    if leaders:
+        for season in _seasons(leaders.get("seasons", seasons)):
+            tasks.extend(("leaders", season, category) for category in leaders.get("categories", ["PTS"]))
+    return tasks
+
+def run_task(kind: str, *args):
+    """Fetches one task's DataFrame. Leader tables are tagged with their season and category."""
+    if kind == "game_log":
+        return api.get_player_game_log(*args)
+    if kind == "team":
+        return api.get_team_yearly_stats(*args)
+    return leaders.fetch(*args)
+
+
+class Checkpoint:
+    """An append-only record of completed tasks."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.done = set()
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                self.done = {tuple(json.loads(line)) for line in f if line.strip()}
+        self._file = open(path, "a", encoding="utf-8")
+
+    def __contains__(self, task) -> bool:
+        return tuple(task) in self.done
+
+    def record(self, task):
+        self.done.add(tuple(task))
+        self._file.write(json.dumps(list(task)) + "\n")
+        self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+
+def run(spec: dict, output_dir: str, max_workers: int = 4, progress=None) -> dict:
+    """
+    Runs every task in a job spec that is not already checkpointed in output_dir.
+    `progress`, if given, is called as progress(done, total, task, error).
+    Returns counts of completed, skipped and failed tasks.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    checkpoint = Checkpoint(os.path.join(output_dir, CHECKPOINT_FILE))
+    tasks = load_tasks(spec)
+    pending = [task for task in tasks if task not in checkpoint]
+    counts = {"completed": 0, "skipped": len(tasks) - len(pending), "failed": 0}
+    try:
+        results = api.iter_concurrently(run_task, pending, max_workers)
+        for done, (task, df, error) in enumerate(results, start=1):
+            if error is None:
+                path = os.path.join(output_dir, OUTPUT_FILES[task[0]])
+                if not df.empty:
+                    df.to_csv(path, mode="a", index=False, header=not os.path.exists(path))
+                checkpoint.record(task)
+                counts["completed"] += 1
+            else:
+                counts["failed"] += 1
+            if progress is not None:
+                progress(done, len(pending), task, error)
+    finally:
+        checkpoint.close()
+    return counts
@@ -0,0 +1,131 @@
+"""Persistent on-disk cache for NBA API responses.
+
+Responses are stored as raw JSON text in a SQLite database, keyed by the
+endpoint name and its request parameters, so repeat lookups survive process
+restarts and skip the stats.nba.com round-trip entirely.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+
+from . import analysis
+
+DEFAULT_PATH = os.environ.get(
+    "NBA_ANALYZER_CACHE",
+    os.path.join(os.path.expanduser("~"), ".nba_analyzer", "cache.sqlite3"),
+)
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+# Completed seasons never change, so their responses never expire. Anything
+# that can still change (the current season, or endpoints that span every
+# season such as year-by-year team stats) is refreshed after a few hours.
+CURRENT_SEASON_TTL = 6 * 60 * 60
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    endpoint TEXT NOT NULL,
+    parameters TEXT NOT NULL,
+    body TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    created REAL NOT NULL,
+    expires REAL,
+    accessed REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed);
+"""
+
+
+def make_key(endpoint: str, parameters: dict) -> str:
+    """Builds a stable cache key from an endpoint name and its parameters.
+
+    Values are compared as the strings sent on the query string, so PlayerID=1
+    and PlayerID='1' share a key.
+    """
+    params = json.dumps({k: "" if v is None else str(v) for k, v in parameters.items()},
+                        sort_keys=True)
+    digest = hashlib.sha1(params.encode("utf-8")).hexdigest()
+    return f"{endpoint.lower()}:{digest}"
+
+def ttl_for(parameters: dict) -> float | None:
+    """Returns the time-to-live in seconds for a request, or None to never expire."""
+    season = parameters.get("Season")
+    if season and season != analysis.current_season():
+        return None
+    return CURRENT_SEASON_TTL
+
+
+class ResponseCache:
+    """A size-bounded SQLite store of raw endpoint responses with LRU eviction."""
+
+    def __init__(self, path: str = DEFAULT_PATH, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.path = path
+        self.max_bytes = max_bytes
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+
+    def get(self, key: str) -> str | None:
+        """Returns the cached body for a key, or None if missing or expired."""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT body, expires FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            body, expires = row
+            if expires is not None and expires <= now:
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                return None
+            self._conn.execute("UPDATE responses SET accessed = ? WHERE key = ?", (now, key))
+            return body
+
+    def set(self, key: str, endpoint: str, parameters: dict, body: str, ttl: float | None = None):
+        """Stores a response body, evicting least recently used entries if over budget."""
+        now = time.time()
+        expires = None if ttl is None else now + ttl
+        size = len(body.encode("utf-8"))
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(key, endpoint, parameters, body, size, created, expires, accessed) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, endpoint, json.dumps(parameters, sort_keys=True, default=str),
+                 body, size, now, expires, now),
+            )
+            self._evict()
+
+    def _evict(self):
+        """Deletes the least recently used entries until the cache fits in max_bytes."""
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        stale = []
+        for key, size in self._conn.execute("SELECT key, size FROM responses ORDER BY accessed"):
+            if total <= self.max_bytes:
+                break
+            stale.append((key,))
+            total -= size
+        self._conn.executemany("DELETE FROM responses WHERE key = ?", stale)
+
+    def size(self) -> int:
+        """Returns the total size in bytes of all cached bodies."""
+        with self._lock:
+            return self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+
+    def clear(self):
+        """Removes every cached response."""
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
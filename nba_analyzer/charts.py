@@ -0,0 +1,181 @@
+"""Embedded trend charts that redraw fast when the selection changes.
+
+A TrendPlot owns one matplotlib Figure with a fixed set of panels, each a
+few line artists. Updating it swaps the lines' data instead of rebuilding
+the figure; when the axis limits still fit the new data, only the lines are
+redrawn and blitted over a cached background. Series longer than the axes
+are wide in pixels are downsampled first, keeping each bucket's min and max
+so spikes survive.
+
+TrendChart embeds a TrendPlot in a Tk frame. matplotlib is imported when the
+first chart is drawn, not at application startup.
+"""
+
+from __future__ import annotations
+
+import tkinter as tk
+from tkinter import ttk
+
+from . import telemetry
+from .lazy import lazy_import
+
+np = lazy_import("numpy")
+
+# Refit an axis when the data no longer fills this fraction of its range.
+MIN_FILL = 0.5
+PADDING = 0.05
+
+
+def downsample(x: np.ndarray, y: np.ndarray, max_points: int) -> tuple[np.ndarray, np.ndarray]:
+    """Reduces a series to at most max_points, keeping the min and max of each bucket in order."""
+    n = len(x)
+    if n <= max_points:
+        return x, y
+    buckets = max(1, max_points // 2)
+    edges = np.linspace(0, n, buckets + 1).astype(int)
+    keep = []
+    filled = np.where(np.isnan(y), np.nanmean(y) if np.isfinite(y).any() else 0, y)
+    for start, end in zip(edges[:-1], edges[1:]):
+        if end <= start:
+            continue
+        chunk = filled[start:end]
+        keep.extend(sorted({start + int(chunk.argmin()), start + int(chunk.argmax())}))
+    keep = np.array(keep)
+    return x[keep], y[keep]
+
+def _range(values: np.ndarray) -> tuple[float, float] | None:
+    values = values[np.isfinite(values)]
+    if not len(values):
+        return None
+    return float(values.min()), float(values.max())
+
+def _refit(current: tuple[float, float], wanted: tuple[float, float] | None) -> tuple[float, float] | None:
+    """
+    Returns new limits if `wanted` falls outside or fills too little of `current`.
+    New limits are padded and rounded outward, so similar data keeps the same axes.
+    """
+    if wanted is None:
+        return None
+    low, high = wanted
+    span = high - low or abs(high) or 1.0
+    if current[0] <= low and high <= current[1] and span >= MIN_FILL * (current[1] - current[0]):
+        return None
+    step = 10 ** np.floor(np.log10(span)) / 2
+    return np.floor((low - PADDING * span) / step) * step, np.ceil((high + PADDING * span) / step) * step
+
+
+class TrendPlot:
+    """A figure of line panels, updated in place.
+
+    `panels` is a list of (title, [(column, label), ...], ylim) tuples; ylim
+    fixes the y range (e.g. (0, 1) for percentages) or is None to fit the data.
+    """
+
+    def __init__(self, figure, canvas, panels, dates: bool = False, max_points: int | None = None):
+        self.figure = figure
+        self.canvas = canvas
+        self.dates = dates
+        self.max_points = max_points
+        self.lines = {}  # column -> (axes, Line2D)
+        self._fixed_ylim = set()
+        self._background = None
+        axes = figure.subplots(len(panels), 1, sharex=True, squeeze=False)[:, 0]
+        for ax, (title, series, ylim) in zip(axes, panels):
+            # A fixed title position spares every full draw a layout pass.
+            ax.set_title(title, fontsize=9, loc="left", y=1.0)
+            ax.grid(True, alpha=0.3)
+            ax.tick_params(labelsize=8)
+            if ylim is not None:
+                ax.set_ylim(*ylim)
+                self._fixed_ylim.add(ax)
+            for column, label in series:
+                (line,) = ax.plot([], [], label=label, linewidth=1.2, animated=True)
+                self.lines[column] = (ax, line)
+            if len(series) > 1:
+                ax.legend(loc="upper left", fontsize=8)
+        if dates:
+            axes[-1].xaxis_date()
+        figure.tight_layout()
+        canvas.mpl_connect("draw_event", self._on_draw)
+
+    def _on_draw(self, event=None):
+        """After a full draw (including resizes), caches the background and redraws the lines."""
+        self._background = self.canvas.copy_from_bbox(self.figure.bbox)
+        self._draw_lines()
+
+    def _draw_lines(self):
+        for ax, line in self.lines.values():
+            ax.draw_artist(line)
+
+    def _point_budget(self, ax) -> int:
+        return self.max_points or max(100, int(ax.bbox.width))
+
+    def update(self, x, data: dict):
+        """Shows data[column] against x for every known column; missing columns are cleared."""
+        with telemetry.span("ui.chart", points=len(x)):
+            if self.dates:
+                from matplotlib.dates import date2num
+                x = date2num(x)
+            x = np.asarray(x, dtype="float64")
+            limits = {}
+            for column, (ax, line) in self.lines.items():
+                y = np.asarray(data[column], dtype="float64") if column in data else np.empty(0)
+                xs, ys = downsample(x, y, self._point_budget(ax)) if len(y) else (y, y)
+                line.set_data(xs, ys)
+                if len(ys):
+                    y_range = _range(ys)
+                    if y_range is not None:
+                        low, high = limits.get(ax, y_range)
+                        limits[ax] = min(low, y_range[0]), max(high, y_range[1])
+
+            full_redraw = False
+            if len(x):
+                ax0 = next(iter(self.lines.values()))[0]
+                new_x = _refit(ax0.get_xlim(), _range(x))
+                if new_x is not None:
+                    ax0.set_xlim(*new_x)  # Axes share x.
+                    full_redraw = True
+            for ax, y_range in limits.items():
+                if ax in self._fixed_ylim:
+                    continue
+                new_y = _refit(ax.get_ylim(), y_range)
+                if new_y is not None:
+                    ax.set_ylim(*new_y)
+                    full_redraw = True
+
+            if full_redraw or self._background is None:
+                self.canvas.draw()  # Calls _on_draw.
+            else:
+                self.canvas.restore_region(self._background)
+                self._draw_lines()
+            self.canvas.blit(self.figure.bbox)
+
+
+class TrendChart(ttk.Frame):
+    """A Tk frame showing a TrendPlot, created on the first update."""
+
+    def __init__(self, parent, panels, dates: bool = False, height: float = 2.6):
+        super().__init__(parent)
+        self.panels = panels
+        self.dates = dates
+        self.height = height
+        self.plot = None
+
+    def _build(self):
+        # Deferred so that matplotlib is only loaded once a chart is shown.
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+        from matplotlib.figure import Figure
+
+        figure = Figure(figsize=(8, self.height * len(self.panels) / 2 + 1), dpi=100)
+        canvas = FigureCanvasTkAgg(figure, master=self)
+        canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        self.plot = TrendPlot(figure, canvas, self.panels, dates=self.dates)
+
+    def update_chart(self, x, data: dict):
+        if self.plot is None:
+            self._build()
+        self.plot.update(x, data)
+
+    def clear(self):
+        if self.plot is not None:
+            self.plot.update([], {})
@@ -0,0 +1,122 @@
+"""Command-line interface for the NBA Data Analyzer.
+
+    python3 -m nba_analyzer team "Los Angeles Lakers"
+    python3 -m nba_analyzer player "LeBron James" 2022-23
+    python3 -m nba_analyzer leaders 2022-23 --top 10
+    python3 -m nba_analyzer leaders 2003-04 --to 2022-23 --category PTS --career
+    python3 -m nba_analyzer scrape job.json --output data/ --workers 4
+    python3 -m nba_analyzer --telemetry timings.json --profile player "LeBron James"
+"""
+
+import argparse
+import json
+import sys
+
+from rich.console import Console
+from rich.progress import BarColumn, MofNCompleteColumn, Progress, ProgressColumn, TextColumn, TimeElapsedColumn
+from rich.text import Text
+
+from . import analysis, api, batch, leaders, telemetry
+
+console = Console()
+
+
+class ThroughputColumn(ProgressColumn):
+    """Renders the task's recent completion rate in requests per second."""
+
+    def render(self, task):
+        return Text(f"{task.speed or 0:.2f} req/s", style="progress.data.speed")
+
+
+def _team(args):
+    team_id = api.get_team_id(args.team)
+    console.print(api.get_team_yearly_stats(team_id).tail(args.rows))
+
+def _player(args):
+    player = api.find_player(args.player)
+    console.print(f"Game log for [bold]{player['full_name']}[/bold] ({args.season}):")
+    console.print(api.get_player_game_log(player["id"], args.season).head(args.rows))
+
+def _leaders(args):
+    if args.to is None and not (args.career or args.per_game):
+        console.print(leaders.top_n(api.get_league_leaders(args.season, args.category), args.category, args.top))
+        return
+    first, last = sorted([args.season, args.to or args.season])
+    seasons = [s for s in analysis.generate_seasons_list() if first <= s <= last]
+    table = leaders.LeadersTable(max_workers=args.workers)
+    table.load(seasons, [args.category])
+    console.print(table.top(args.category, seasons, n=args.top, career=args.career, per_game=args.per_game))
+
+def _scrape(args):
+    with open(args.spec, encoding="utf-8") as f:
+        spec = json.load(f)
+    columns = [TextColumn("[bold blue]Scraping"), BarColumn(), MofNCompleteColumn(),
+               ThroughputColumn(), TimeElapsedColumn(), TextColumn("{task.description}")]
+    with Progress(*columns, console=console) as progress:
+        task_id = progress.add_task("", total=None)
+
+        def report(done, total, task, error):
+            status = f"[red]failed {task}: {error}" if error else str(task)
+            progress.update(task_id, completed=done, total=total, description=status)
+
+        counts = batch.run(spec, args.output, max_workers=args.workers, progress=report)
+    console.print(f"Completed {counts['completed']}, skipped {counts['skipped']} already done, "
+                  f"failed {counts['failed']}. Output in [bold]{args.output}[/bold].")
+    return 1 if counts["failed"] else 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="nba_analyzer", description="Analyze NBA team and player statistics.")
+    parser.add_argument("--telemetry", metavar="PATH",
+                        help="Write per-call timings to PATH (.json with a latency summary, or .csv).")
+    parser.add_argument("--profile", action="store_true",
+                        help="Sample stacks while running; the samples are included in --telemetry JSON.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    team = commands.add_parser("team", help="Show a team's year-by-year history.")
+    team.add_argument("team", help="Team name or abbreviation, e.g. 'Los Angeles Lakers' or LAL.")
+    team.add_argument("--rows", type=int, default=10, help="Number of most recent seasons to show.")
+    team.set_defaults(func=_team)
+
+    player = commands.add_parser("player", help="Show a player's game log for a season.")
+    player.add_argument("player")
+    player.add_argument("season", nargs="?", default=analysis.current_season())
+    player.add_argument("--rows", type=int, default=10)
+    player.set_defaults(func=_player)
+
+    leaders = commands.add_parser("leaders", help="Show league leaders for a season.")
+    leaders.add_argument("season", nargs="?", default=analysis.current_season())
+    leaders.add_argument("--category", default="PTS")
+    leaders.add_argument("--top", type=int, default=10)
+    leaders.add_argument("--to", metavar="SEASON", help="Rank over every season from SEASON's start to this one.")
+    leaders.add_argument("--career", action="store_true", help="Combine each player's seasons in the range.")
+    leaders.add_argument("--per-game", action="store_true", help="Rank counting stats per game played.")
+    leaders.add_argument("--workers", type=int, default=4)
+    leaders.set_defaults(func=_leaders)
+
+    scrape = commands.add_parser("scrape", help="Run a batch job spec, resuming from its checkpoint.")
+    scrape.add_argument("spec", help="Path to a JSON job spec (see nba_analyzer.batch).")
+    scrape.add_argument("--output", "-o", default="nba_data", help="Directory for CSV output and checkpoint.")
+    scrape.add_argument("--workers", type=int, default=4)
+    scrape.set_defaults(func=_scrape)
+    return parser
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+    if args.profile:
+        telemetry.start_profiler()
+    try:
+        return args.func(args) or 0
+    except (ValueError, OSError) as e:  # OSError covers connection errors and timeouts.
+        console.print(f"[red]Error:[/red] {e}")
+        return 1
+    except KeyboardInterrupt:
+        console.print("Interrupted; rerun the same command to resume.")
+        return 130
+    finally:
+        telemetry.stop_profiler()
+        if args.telemetry:
+            telemetry.export(args.telemetry)
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,151 @@
+"""Recorded-response stand-in for the stats.nba.com HTTP layer.
+
+A FixtureTransport can be passed to api.set_transport() so that endpoint
+calls are answered from JSON files on disk instead of the network. Given a
+live transport to record from, missing fixtures are fetched once and saved.
+
+FakeStatsServer serves the same fixtures over real local HTTP (or HTTPS),
+with injected latency and periodic 429 responses, for exercising the
+concurrent fetch path and connection reuse.
+"""
+
+import gzip
+import os
+import ssl
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlsplit
+
+from nba_api.stats.library.http import NBAStatsHTTP, NBAStatsResponse
+
+from . import cache
+
+
+class FixtureTransport:
+    """Replays (and optionally records) endpoint responses from a directory."""
+
+    def __init__(self, directory: str, record_from=None):
+        self.directory = directory
+        self.record_from = record_from
+        self.requests = 0
+        os.makedirs(directory, exist_ok=True)
+
+    def fixture_path(self, endpoint: str, parameters: dict) -> str:
+        """Returns the file a given request is recorded to."""
+        name = cache.make_key(endpoint, parameters).replace(":", "-")
+        return os.path.join(self.directory, f"{name}.json")
+
+    def send_api_request(self, endpoint, parameters, **kwargs):
+        self.requests += 1
+        path = self.fixture_path(endpoint, parameters)
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                body = f.read()
+        elif self.record_from is not None:
+            body = self.record_from.send_api_request(
+                endpoint=endpoint, parameters=parameters, **kwargs
+            ).get_response()
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(body)
+        else:
+            raise ConnectionError(f"No recorded fixture for {endpoint} {parameters}")
+        return NBAStatsResponse(response=body, status_code=200, url=path)
+
+
+class FakeStatsServer:
+    """A local HTTP server answering stats.nba.com requests from recorded fixtures.
+
+    Every request sleeps for `latency` seconds, and every `throttle_every`-th
+    request (if non-zero) is answered with HTTP 429. Given a PEM `certfile`
+    (certificate and key), it serves HTTPS. Connections are kept alive, and
+    `connections` counts how many clients opened.
+    """
+
+    def __init__(self, directory: str, latency: float = 0.0, throttle_every: int = 0, certfile: str | None = None):
+        self.fixtures = FixtureTransport(directory)
+        self.latency = latency
+        self.throttle_every = throttle_every
+        self.requests = 0
+        self.throttled = 0
+        self.connections = 0
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self._scheme = "http"
+        if certfile:
+            context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+            context.load_cert_chain(certfile)
+            self._server.socket = context.wrap_socket(self._server.socket, server_side=True)
+            self._scheme = "https"
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"{self._scheme}://{host}:{port}/stats/{{endpoint}}"
+
+    def transport(self):
+        """Returns an nba_api HTTP transport pointed at this server."""
+        return type("FakeStatsHTTP", (NBAStatsHTTP,), {"base_url": self.base_url})()
+
+    def start(self) -> "FakeStatsServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def _respond(self, path: str) -> tuple[int, str]:
+        with self._lock:
+            self.requests += 1
+            throttle = self.throttle_every and self.requests % self.throttle_every == 0
+            if throttle:
+                self.throttled += 1
+        time.sleep(self.latency)
+        if throttle:
+            return 429, ""
+        url = urlsplit(path)
+        endpoint = url.path.rstrip("/").rsplit("/", 1)[-1]
+        parameters = dict(parse_qsl(url.query, keep_blank_values=True))
+        try:
+            response = self.fixtures.send_api_request(endpoint, parameters)
+        except ConnectionError:
+            return 404, ""
+        return 200, response.get_response()
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # Keep connections alive between requests.
+            disable_nagle_algorithm = True  # Headers and body are separate writes.
+
+            def setup(self):
+                super().setup()
+                with server._lock:
+                    server.connections += 1
+
+            def do_GET(self):
+                status, body = server._respond(self.path)
+                data = body.encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                if "gzip" in self.headers.get("Accept-Encoding", ""):
+                    data = gzip.compress(data)
+                    self.send_header("Content-Encoding", "gzip")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
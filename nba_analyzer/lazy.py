@@ -0,0 +1,39 @@
+"""Deferred imports for heavy dependencies.
+
+pandas, numpy and nba_api's endpoint package each take hundreds of
+milliseconds to import. Modules on the GUI startup path bind them with
+lazy_import() so the window can appear before they are first used.
+"""
+
+import importlib
+import sys
+
+
+class _LazyModule:
+    """Stands in for a module and imports it on first attribute access.
+
+    importlib's LazyLoader is not thread-safe before Python 3.12: threads that
+    touch the module while another is executing it can see it half-initialized.
+    import_module() holds the import lock, so concurrent first uses all wait for
+    a complete module.
+    """
+
+    def __init__(self, name: str):
+        self._name = name
+        self._module = None
+
+    def __getattr__(self, attr: str):
+        module = self._module
+        if module is None:
+            module = self._module = importlib.import_module(self._name)
+        return getattr(module, attr)
+
+    def __repr__(self):
+        return f"<lazy module {self._name!r}>"
+
+
+def lazy_import(name: str):
+    """Returns the named module, deferring its actual import until first attribute access."""
+    if name in sys.modules:
+        return sys.modules[name]
+    return _LazyModule(name)
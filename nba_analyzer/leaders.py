@@ -0,0 +1,130 @@
+"""League leaders across seasons and stat categories.
+
+LeagueLeaders responses (season totals per player, qualified for the
+requested category) are fetched concurrently for every missing
+(season, category) pair and kept in memory, so rankings over any season
+range are answered from the loaded frames without further requests::
+
+    table = LeadersTable()
+    table.load(["2015-16", "2016-17"], ["PTS"])
+    table.top("PTS", ["2015-16", "2016-17"], n=10)                 # best single seasons
+    table.top("PTS", ["2015-16", "2016-17"], career=True)          # most points over the range
+    table.top("PTS", ["2015-16", "2016-17"], per_game=True)        # best points per game seasons
+"""
+
+from __future__ import annotations
+
+import threading
+
+from . import api
+from .lazy import lazy_import
+
+np = lazy_import("numpy")
+pd = lazy_import("pandas")
+
+CATEGORIES = ["PTS", "REB", "AST", "STL", "BLK", "FG_PCT", "FG3_PCT", "FT_PCT", "EFF", "AST_TOV", "STL_TOV",
+              "FGM", "FGA", "FG3M", "FG3A", "FTM", "FTA", "OREB", "DREB", "TOV", "MIN"]
+# Rate stats are recomputed from their totals when seasons are combined.
+RATIOS = {
+    "FG_PCT": ("FGM", "FGA"),
+    "FG3_PCT": ("FG3M", "FG3A"),
+    "FT_PCT": ("FTM", "FTA"),
+    "AST_TOV": ("AST", "TOV"),
+    "STL_TOV": ("STL", "TOV"),
+}
+
+
+def fetch(season: str, category: str) -> pd.DataFrame:
+    """Fetches one season's leaders in a category, tagged with SEASON and STAT_CATEGORY."""
+    return api.get_league_leaders(season, category).assign(SEASON=season, STAT_CATEGORY=category)
+
+def _values(df: pd.DataFrame, stat: str, per_game: bool) -> np.ndarray:
+    """Returns the stat for each row of season totals, as a rate or per game if requested."""
+    if stat in RATIOS:
+        made, attempted = (df[col].to_numpy(dtype="float64") for col in RATIOS[stat])
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(attempted > 0, made / attempted, np.nan)
+    values = df[stat].to_numpy(dtype="float64")
+    if per_game:
+        games = df["GP"].to_numpy(dtype="float64")
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(games > 0, values / games, np.nan)
+    return values
+
+def _largest(values: np.ndarray, n: int) -> np.ndarray:
+    """Returns the positions of the n largest values, largest first, without a full sort."""
+    valid = np.flatnonzero(~np.isnan(values))
+    if len(valid) > n:
+        valid = valid[np.argpartition(-values[valid], n - 1)[:n]]
+    return valid[np.argsort(-values[valid], kind="stable")]
+
+def top_n(df: pd.DataFrame, stat: str = "PTS", n: int = 10) -> pd.DataFrame:
+    """Returns the n rows of a leaders frame with the highest `stat`."""
+    return df.nlargest(n, stat, keep="first")
+
+
+class LeadersTable:
+    """Leaders frames for many seasons and categories, with range rankings over them."""
+
+    def __init__(self, max_workers: int = 4):
+        self.max_workers = max_workers
+        self._frames = {}  # (season, category) -> DataFrame
+        self._by_category = {}  # category -> all its loaded seasons in one frame
+        self._lock = threading.Lock()
+
+    def missing(self, seasons, categories) -> list[tuple[str, str]]:
+        """Returns the (season, category) pairs not loaded yet."""
+        with self._lock:
+            return [(s, c) for c in categories for s in seasons if (s, c) not in self._frames]
+
+    def load(self, seasons, categories):
+        """
+        Fetches every missing (season, category) concurrently. Pairs that still fail
+        after retrying are left out; a ConnectionError naming them is raised once the
+        rest are loaded.
+        """
+        failed = []
+        for (season, category), df, error in api.iter_concurrently(fetch, self.missing(seasons, categories),
+                                                                   self.max_workers):
+            if error is not None:
+                failed.append(f"{category} {season}")
+                continue
+            with self._lock:
+                self._frames[season, category] = df
+                self._by_category.pop(category, None)
+        if failed:
+            raise ConnectionError(f"Could not fetch league leaders for {', '.join(sorted(failed))}")
+
+    def _category(self, category: str) -> pd.DataFrame:
+        with self._lock:
+            if category not in self._by_category:
+                frames = [df for (_, c), df in sorted(self._frames.items()) if c == category]
+                self._by_category[category] = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+            return self._by_category[category]
+
+    def top(self, stat: str, seasons, n: int = 10, career: bool = False, per_game: bool = False) -> pd.DataFrame:
+        """
+        Ranks the loaded leaders in `stat` over `seasons`. By default each player-season
+        is ranked on its own; with `career`, seasons are combined per player. `per_game`
+        divides counting stats by games played. Returns a frame with a RANK column.
+        """
+        df = self._category(stat)
+        if df.empty:
+            return pd.DataFrame()
+        df = df[df["SEASON"].isin(list(seasons))]
+        label = f"{stat}_PER_GAME" if per_game and stat not in RATIOS else stat
+        if career:
+            totals = ["GP"] + ([*RATIOS[stat]] if stat in RATIOS else [stat])
+            df = df.groupby("PLAYER_ID", sort=False).agg(
+                PLAYER=("PLAYER", "last"), TEAM=("TEAM", "last"), SEASONS=("SEASON", "nunique"),
+                **{col: (col, "sum") for col in totals},
+            ).reset_index()
+            columns = ["PLAYER_ID", "PLAYER", "TEAM", "SEASONS", "GP"]
+        else:
+            columns = ["PLAYER_ID", "PLAYER", "TEAM", "SEASON", "GP"]
+        values = _values(df, stat, per_game)
+        order = _largest(values, n)
+        shown = df[stat].to_numpy() if label == stat and stat not in RATIOS else values
+        result = df.iloc[order][columns].assign(**{label: shown[order]}).reset_index(drop=True)
+        result.insert(0, "RANK", np.arange(1, len(result) + 1))
+        return result
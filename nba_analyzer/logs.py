@@ -0,0 +1,120 @@
+"""Shared logging setup for the NBA Data Analyzer scripts.
+
+configure() installs a QueueHandler on the root logger, so a log call on the
+Tk or worker threads only puts the record on a queue; a QueueListener thread
+formats it and writes it to a rotating file as one JSON object per line (and
+as plain text to stderr). Fields passed with ``extra=`` become JSON keys, and
+telemetry spans are logged at DEBUG on "nba_analyzer.telemetry" with their
+timing fields (span, duration_ms, endpoint, status, cache, ...).
+
+Third-party loggers (matplotlib's font scoring, urllib3's connection chatter,
+PIL) are capped at WARNING. Set NBA_ANALYZER_LOG to change levels, e.g.
+``DEBUG`` or ``INFO,nba_analyzer.api=DEBUG,matplotlib=INFO``.
+"""
+
+import atexit
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import sys
+
+MAX_BYTES = 5 * 1024 * 1024
+BACKUPS = 3
+TEXT_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+QUIET_LOGGERS = {name: logging.WARNING for name in ("matplotlib", "PIL", "urllib3", "requests", "asyncio")}
+# LogRecord attributes; anything else on a record came from `extra`.
+RESERVED_ATTRS = frozenset(vars(logging.makeLogRecord({}))) | {"message", "asctime", "taskName"}
+
+_listener = None
+
+
+class JsonFormatter(logging.Formatter):
+    """Formats a record as one JSON object: time, level, logger, thread, message and any extra fields."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": f"{self.formatTime(record, '%Y-%m-%dT%H:%M:%S')}.{int(record.msecs):03d}",
+            "level": record.levelname,
+            "logger": record.name,
+            "thread": record.threadName,
+            "message": record.getMessage(),
+        }
+        entry.update((key, value) for key, value in vars(record).items() if key not in RESERVED_ATTRS)
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+
+class _QueueHandler(logging.handlers.QueueHandler):
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Only merge the arguments here (they may change after the call); formatting, including
+        # any traceback, is left to the listener thread. The root logger's only handler is this
+        # one, so the record needs no defensive copy.
+        record.msg, record.args = record.getMessage(), None
+        return record
+
+
+def extra_fields(fields: dict) -> dict:
+    """Returns `fields` without keys that would clash with LogRecord attributes, for use as `extra`."""
+    return {key: value for key, value in fields.items() if key not in RESERVED_ATTRS}
+
+def parse_levels(spec: str) -> tuple[str | None, dict]:
+    """Parses 'LEVEL,logger=LEVEL,...' into the root level (or None) and per-logger levels."""
+    root, levels = None, {}
+    for item in filter(None, (part.strip() for part in spec.split(","))):
+        name, _, level = item.rpartition("=")
+        if name:
+            levels[name] = level.upper()
+        else:
+            root = level.upper()
+    return root, levels
+
+def configure(path: str | None = None, level=logging.INFO, levels: dict | None = None, console: bool = True,
+              max_bytes: int = MAX_BYTES, backups: int = BACKUPS) -> logging.handlers.QueueListener:
+    """
+    Routes all logging through a background writer: JSON lines to a rotating file at `path`
+    (if given) and text to stderr (if `console`). `levels` sets per-logger levels on top of
+    QUIET_LOGGERS; NBA_ANALYZER_LOG overrides both. Replaces any earlier root handlers.
+    """
+    global _listener
+    shutdown()
+    handlers = []
+    if path:
+        file_handler = logging.handlers.RotatingFileHandler(path, maxBytes=max_bytes, backupCount=backups,
+                                                            encoding="utf-8", delay=True)
+        file_handler.setFormatter(JsonFormatter())
+        handlers.append(file_handler)
+    if console:
+        stream_handler = logging.StreamHandler(sys.stderr)
+        stream_handler.setFormatter(logging.Formatter(TEXT_FORMAT))
+        handlers.append(stream_handler)
+
+    env_level, env_levels = parse_levels(os.environ.get("NBA_ANALYZER_LOG", ""))
+    root = logging.getLogger()
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+        handler.close()
+    records = queue.SimpleQueue()
+    root.addHandler(_QueueHandler(records))
+    root.setLevel(env_level or level)
+    for name, logger_level in {**QUIET_LOGGERS, **(levels or {}), **env_levels}.items():
+        logging.getLogger(name).setLevel(logger_level)
+
+    _listener = logging.handlers.QueueListener(records, *handlers, respect_handler_level=True)
+    _listener.start()
+    return _listener
+
+def shutdown():
+    """Writes out any queued records and stops the writer thread."""
+    global _listener
+    if _listener is None:
+        return
+    _listener.stop()
+    for handler in _listener.handlers:
+        handler.close()
+    _listener = None
+
+
+atexit.register(shutdown)
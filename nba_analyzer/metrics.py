@@ -0,0 +1,151 @@
+"""Vectorized rolling, cumulative and advanced player metrics over game logs."""
+
+import numpy as np
+import pandas as pd
+from . import analysis, telemetry
+
+DEFAULT_STATS = ("PTS", "REB", "AST", "STL", "BLK", "TOV", "FGM", "FGA", "FG3M", "FTM", "FTA", "MIN")
+DEFAULT_WINDOW = 10
+PLAYER_KEY = "Player_ID"
+
+
+def _column(df: pd.DataFrame, col: str) -> np.ndarray:
+    # Game logs are downcast to small integer dtypes, so do arithmetic in float64.
+    return df[col].to_numpy(dtype="float64", na_value=np.nan)
+
+def _ratio(num: np.ndarray, den: np.ndarray) -> np.ndarray:
+    """Divides element-wise, returning NaN where the denominator is zero."""
+    return np.divide(num, den, out=np.full(num.shape, np.nan), where=den != 0)
+
+@telemetry.timed("metrics.add_advanced_rates")
+def add_advanced_rates(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Adds per-game TS_PCT (true shooting), EFG_PCT (effective field goal), per-36
+    minute PTS/REB/AST and USG_PROXY (possessions used per 36 minutes,
+    FGA + 0.44 * FTA + TOV) for whichever input columns are present.
+    """
+    cols = set(df.columns)
+    rates = {}
+    if {"PTS", "FGA", "FTA"} <= cols:
+        rates["TS_PCT"] = _ratio(_column(df, "PTS"), 2 * (_column(df, "FGA") + 0.44 * _column(df, "FTA")))
+    if {"FGM", "FG3M", "FGA"} <= cols:
+        rates["EFG_PCT"] = _ratio(_column(df, "FGM") + 0.5 * _column(df, "FG3M"), _column(df, "FGA"))
+    if "MIN" in cols:
+        minutes = _column(df, "MIN")
+        for stat in ("PTS", "REB", "AST"):
+            if stat in cols:
+                rates[f"{stat}_PER36"] = _ratio(36 * _column(df, stat), minutes)
+        if {"FGA", "FTA", "TOV"} <= cols:
+            used = _column(df, "FGA") + 0.44 * _column(df, "FTA") + _column(df, "TOV")
+            rates["USG_PROXY"] = _ratio(36 * used, minutes)
+    return df.assign(**rates)
+
+def home_away_splits(df: pd.DataFrame, stats=DEFAULT_STATS, by: str = PLAYER_KEY) -> pd.DataFrame:
+    """Returns per-game averages of each stat split by LOCATION, one row per group."""
+    stats = [s for s in stats if s in df.columns]
+    values = df[stats].astype("float64")
+    return values.groupby([df[by], df["LOCATION"]], observed=True).mean().unstack("LOCATION")
+
+
+class MetricsEngine:
+    """
+    Computes grouped rolling (last-N games) averages, expanding career averages,
+    win/loss streaks and advanced rates over a game log, and keeps them up to date
+    as new games arrive. update() only recomputes the appended games, using the
+    last window-1 stored games and running per-group totals as context.
+    """
+
+    def __init__(self, stats=DEFAULT_STATS, window: int = DEFAULT_WINDOW, by: str = PLAYER_KEY):
+        self.stats = list(stats)
+        self.window = window
+        self.by = by
+        self.frame = None  # Raw game rows plus computed metric columns
+        self._raw_columns = None
+        self._totals = None  # Per-group running stat sums, GAMES_PLAYED and STREAK
+
+    @telemetry.timed("metrics.update")
+    def update(self, games: pd.DataFrame) -> pd.DataFrame:
+        """Adds new games and returns the full frame with metrics."""
+        games = self._prepare(games)
+        if games.empty:
+            return self.frame if self.frame is not None else games
+        if self.frame is not None and self._is_backfill(games):
+            # Older games arrived out of order, so running state is invalid: rebuild.
+            games = pd.concat([self.frame[self._raw_columns], games], ignore_index=True)
+            self.frame = self._totals = None
+            games = self._prepare(games)
+        if self.frame is None:
+            self._raw_columns = list(games.columns)
+
+        computed = self._compute(games)
+        self.frame = computed if self.frame is None else pd.concat([self.frame, computed], ignore_index=True)
+        return self.frame
+
+    def _prepare(self, games: pd.DataFrame) -> pd.DataFrame:
+        """Parses dates, drops games already stored and sorts chronologically within each group."""
+        if not pd.api.types.is_datetime64_any_dtype(games["GAME_DATE"]):
+            games = analysis.process_player_gamelog(games)
+        games = games.drop_duplicates([self.by, "Game_ID"])
+        if self.frame is not None:
+            seen = pd.MultiIndex.from_frame(self.frame[[self.by, "Game_ID"]])
+            games = games[~pd.MultiIndex.from_frame(games[[self.by, "Game_ID"]]).isin(seen)]
+        return games.sort_values([self.by, "GAME_DATE"], kind="stable").reset_index(drop=True)
+
+    def _is_backfill(self, games: pd.DataFrame) -> bool:
+        last_stored = self.frame.groupby(self.by)["GAME_DATE"].max()
+        first_new = games.groupby(self.by)["GAME_DATE"].min()
+        return bool((first_new <= last_stored.reindex(first_new.index)).any())
+
+    def _compute(self, games: pd.DataFrame) -> pd.DataFrame:
+        stats = [s for s in self.stats if s in games.columns]
+        keys = games[self.by]
+        values = games[stats].astype("float64")
+        prior = self._totals.reindex(keys.to_numpy()) if self._totals is not None else None
+
+        # Rolling last-N averages, with the previous window-1 stored games as context
+        combined, combined_keys, offset = values, keys.to_numpy(), 0
+        if self.frame is not None:
+            stored = self.frame[self.frame[self.by].isin(keys.unique())]
+            context = stored.groupby(self.by).tail(self.window - 1)
+            if not context.empty:
+                combined = pd.concat([context[stats].astype("float64"), values], ignore_index=True)
+                combined_keys = np.concatenate([context[self.by].to_numpy(), combined_keys])
+                offset = len(context)
+        rolled = (combined.groupby(combined_keys).rolling(self.window, min_periods=1).mean()
+                  .reset_index(level=0, drop=True).sort_index().iloc[offset:])
+
+        # Expanding career totals, continued from the running per-group totals
+        cumulative = values.groupby(keys).cumsum()
+        games_played = keys.groupby(keys).cumcount().to_numpy() + 1
+        if prior is not None:
+            cumulative += prior[stats].fillna(0).to_numpy()
+            games_played += prior["GAMES_PLAYED"].fillna(0).to_numpy(dtype="int64")
+
+        metrics = {f"{s}_LAST{self.window}": rolled[s].to_numpy() for s in stats}
+        metrics.update({f"{s}_CAREER_AVG": cumulative[s].to_numpy() / games_played for s in stats})
+        metrics["GAMES_PLAYED"] = games_played
+        if "WL" in games.columns:
+            metrics["STREAK"] = self._streaks(games, keys, prior)
+        computed = add_advanced_rates(games).assign(**metrics)
+
+        totals = cumulative.assign(GAMES_PLAYED=games_played, STREAK=metrics.get("STREAK", 0))
+        totals = totals.groupby(keys.to_numpy()).last()
+        self._totals = totals if self._totals is None else pd.concat(
+            [self._totals.drop(totals.index, errors="ignore"), totals])
+        return computed
+
+    @staticmethod
+    def _streaks(games: pd.DataFrame, keys: pd.Series, prior: pd.DataFrame | None) -> np.ndarray:
+        """Signed win/loss streak after each game: +3 is three straight wins, -2 two straight losses."""
+        win = (games["WL"] == "W").to_numpy()
+        new_run = (win != np.roll(win, 1)) | (keys.to_numpy() != np.roll(keys.to_numpy(), 1))
+        new_run[:1] = True
+        run_id = pd.Series(np.cumsum(new_run))
+        length = run_id.groupby(run_id).cumcount().to_numpy() + 1
+        if prior is not None:
+            # The first run of each group continues the stored streak if it has the same sign.
+            first_run = (run_id == run_id.groupby(keys).transform("first")).to_numpy()
+            previous = prior["STREAK"].fillna(0).to_numpy()
+            continues = first_run & (np.sign(previous) == np.where(win, 1, -1))
+            length = length + np.where(continues, np.abs(previous), 0).astype("int64")
+        return np.where(win, length, -length)
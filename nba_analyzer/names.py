@@ -0,0 +1,127 @@
+"""Prebuilt name indexes for fast player and team lookups.
+
+A NameIndex is built once over a list of player or team dicts and answers
+exact, prefix, substring and typo-tolerant (trigram) queries without
+rescanning or re-lowercasing the whole list on every call.
+"""
+
+import re
+import unicodedata
+from bisect import bisect_left
+from collections import Counter
+
+# Minimum trigram similarity for a fuzzy match to be returned.
+FUZZY_THRESHOLD = 0.3
+
+EXACT, PREFIX, WORD_PREFIX, SUBSTRING, FUZZY = range(5)
+
+
+def normalize(name: str) -> str:
+    """Lowercases a name and strips accents and punctuation, e.g. 'Nikola Jokić' -> 'nikola jokic'."""
+    text = unicodedata.normalize("NFKD", name)
+    text = "".join(c for c in text if not unicodedata.combining(c)).lower()
+    text = re.sub(r"[.']", "", text)
+    return " ".join(re.sub(r"[^\w]", " ", text).split())
+
+def trigrams(text: str) -> set[str]:
+    """Returns the set of character trigrams of a space-padded normalized name."""
+    padded = f" {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class NameIndex:
+    """An in-memory index over the names of player or team dicts.
+
+    Each dict is indexed under every field in `fields` (e.g. full name and
+    abbreviation for teams). Results rank exact matches first, then prefix,
+    word-prefix, substring and fuzzy matches, with active entries ahead of
+    inactive ones within a rank (fuzzy matches are ordered by similarity first).
+    """
+
+    def __init__(self, entries, fields=("full_name",), active_key: str = "is_active"):
+        self.entries = list(entries)
+        self._active = [bool(e.get(active_key, True)) for e in self.entries]
+        self._names = []  # (normalized name, entry position)
+        self._exact = {}
+        prefixes = []
+        for pos, entry in enumerate(self.entries):
+            for field in fields:
+                if not entry.get(field):
+                    continue
+                name = normalize(str(entry[field]))
+                name_id = len(self._names)
+                self._names.append((name, pos))
+                self._exact.setdefault(name, []).append(pos)
+                prefixes.append((name, PREFIX, name_id))
+                for match in re.finditer(r" (\w)", name):
+                    prefixes.append((name[match.start(1):], WORD_PREFIX, name_id))
+        self._prefixes = sorted(prefixes)
+        self._grams = {}
+        self._gram_counts = []
+        for name_id, (name, _) in enumerate(self._names):
+            grams = trigrams(name)
+            self._gram_counts.append(len(grams))
+            for gram in grams:
+                self._grams.setdefault(gram, []).append(name_id)
+
+    def __len__(self):
+        return len(self.entries)
+
+    def exact(self, name: str) -> dict | None:
+        """Returns the entry whose indexed name matches exactly (ignoring case and accents)."""
+        matches = self._exact.get(normalize(name))
+        if not matches:
+            return None
+        return self.entries[min(matches, key=lambda pos: not self._active[pos])]
+
+    def search(self, query: str, limit: int = 10, fuzzy: bool = True) -> list[dict]:
+        """Returns up to `limit` entries matching the query, best first."""
+        q = normalize(query)
+        if not q:
+            return []
+        best = {}
+
+        def consider(name_id, rank, similarity=1.0):
+            pos = self._names[name_id][1]
+            score = (rank, -similarity, not self._active[pos])
+            if pos not in best or score < best[pos]:
+                best[pos] = score
+
+        for pos in self._exact.get(q, ()):
+            best[pos] = (EXACT, -1.0, not self._active[pos])
+
+        start = bisect_left(self._prefixes, (q,))
+        for text, rank, name_id in self._prefixes[start:]:
+            if not text.startswith(q):
+                break
+            consider(name_id, rank)
+
+        query_grams = trigrams(q)
+        # A name can only contain the query if it shares all of its unpadded trigrams.
+        core = len({q[i:i + 3] for i in range(len(q) - 2)}) if len(q) >= 3 else None
+        shared = Counter()
+        for gram in query_grams:
+            shared.update(self._grams.get(gram, ()))
+        for name_id, count in shared.items():
+            name = self._names[name_id][0]
+            if core is not None and count >= core and q in name:
+                consider(name_id, SUBSTRING)
+            elif fuzzy:
+                similarity = count / (len(query_grams) + self._gram_counts[name_id] - count)
+                if similarity >= FUZZY_THRESHOLD:
+                    consider(name_id, FUZZY, similarity)
+
+        ranked = sorted(best, key=lambda pos: (best[pos], self.entries[pos].get("full_name", "")))
+        return [self.entries[pos] for pos in ranked[:limit]]
+
+    def find(self, query: str, fuzzy: bool = False) -> dict | None:
+        """Returns the single best match for a query, or None."""
+        match = self.exact(query)
+        if match is not None:
+            return match
+        results = self.search(query, limit=1, fuzzy=fuzzy)
+        return results[0] if results else None
+
+    def resolve(self, queries, fuzzy: bool = True) -> list[dict | None]:
+        """Resolves many names at once, returning the best match (or None) for each."""
+        return [self.find(query, fuzzy=fuzzy) for query in queries]
@@ -0,0 +1,200 @@
+"""Background prefetching of the requests a user is likely to make next.
+
+Lookups are strongly patterned: the same player across consecutive seasons,
+or a team followed by its players. After each load, the caller schedules the
+predicted next requests (see after_player_season and after_team) and a
+Prefetcher fetches them on a background thread, so the next click is
+answered from memory. Prefetching yields to foreground requests (a job only
+starts while none is running), is capped at `budget` fetches per `period`
+seconds, and newer predictions replace queued older ones.
+
+stats() reports hits (lookups served by a prefetch), misses, and wasted
+prefetches (fetched but evicted, expired or never used), for tuning the
+policy. Lookups are also recorded as "prefetch.get" telemetry spans.
+"""
+
+from __future__ import annotations
+
+import collections
+import logging
+import threading
+import time
+from concurrent.futures import Future
+
+from . import analysis, api, telemetry, throttle
+
+logger = logging.getLogger(__name__)
+
+COUNTERS = ("scheduled", "fetched", "failed", "dropped", "hits", "misses", "wasted")
+
+
+def adjacent_seasons(season: str) -> list[str]:
+    """Returns the seasons either side of `season` that have data, the previous one first."""
+    available = set(analysis.generate_seasons_list())
+    start_year = int(season[:4])
+    seasons = (f"{year}-{str(year + 1)[-2:]}" for year in (start_year - 1, start_year + 1))
+    return [s for s in seasons if s in available]
+
+def after_player_season(player_id: int, season: str) -> list[tuple]:
+    """Predicts the requests following a player-season: the same player's adjacent seasons."""
+    return [(api.get_player_game_log, (player_id, s)) for s in adjacent_seasons(season)]
+
+def after_team(team_id: int, season: str | None = None) -> list[tuple]:
+    """Predicts the requests following a team: its roster, then each rostered player's game log."""
+    season = season or analysis.current_season()
+
+    def roster_logs(roster):
+        return [(api.get_player_game_log, (int(player_id), season)) for player_id in roster["PLAYER_ID"]]
+
+    return [(api.get_team_roster, (team_id, season), roster_logs)]
+
+
+class Prefetcher:
+    """Fetches predicted requests in the background and hands each result to the first caller asking for it.
+
+    A request is a (func, args) tuple, optionally with a third item `then`:
+    a function of the result returning follow-up requests to queue. Results
+    are handed out once; repeated lookups are left to the response cache.
+    """
+
+    def __init__(self, budget: int = 20, period: float = 60.0, max_entries: int = 32, ttl: float = 600.0):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._budget = throttle.TokenBucket(rate=budget / period, capacity=budget)
+        self._cond = threading.Condition()
+        self._entries = collections.OrderedDict()  # (func, args) -> (Future, expiry or None while pending)
+        self._queue = collections.deque()  # (key, then) waiting to be fetched
+        self._recent = collections.deque(maxlen=max_entries)  # Keys just requested in the foreground
+        self._foreground = 0
+        self._closed = False
+        self._thread = None
+        self.counts = dict.fromkeys(COUNTERS, 0)
+
+    def get(self, func, *args):
+        """Returns func(*args), taking the prefetched result if there is one."""
+        key = (func, args)
+        with telemetry.span("prefetch.get", func=func.__name__) as get_span:
+            with self._cond:
+                self._expire()
+                self._recent.append(key)
+                entry = self._entries.pop(key, None)
+                # A prefetch still queued is cancelled and the call made here instead.
+                future = entry[0] if entry is not None and not entry[0].cancel() else None
+            if future is not None:
+                try:
+                    result = future.result()
+                except Exception:
+                    pass  # The prefetch failed; try again below.
+                else:
+                    get_span["cache"] = "hit"
+                    self._count("hits")
+                    return result
+            get_span["cache"] = "miss"
+            with self._cond:
+                self.counts["misses"] += 1
+                self._foreground += 1
+            try:
+                return func(*args)
+            finally:
+                with self._cond:
+                    self._foreground -= 1
+                    self._cond.notify_all()
+
+    def schedule(self, requests):
+        """Queues requests to prefetch, replacing those still queued from earlier predictions."""
+        with self._cond:
+            if self._closed:
+                return
+            for key, _ in self._queue:
+                entry = self._entries.get(key)
+                if entry is not None and entry[0].cancel():
+                    del self._entries[key]
+                    self.counts["dropped"] += 1
+            self._queue.clear()
+            self._enqueue(requests)
+
+    def stats(self) -> dict:
+        """Returns the counters plus hit_rate, the share of lookups served by a prefetch."""
+        with self._cond:
+            stats = dict(self.counts)
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = stats["hits"] / lookups if lookups else 0.0
+        return stats
+
+    def close(self):
+        """Stops prefetching. Results never used are counted as wasted."""
+        with self._cond:
+            self._closed = True
+            for future, _ in self._entries.values():
+                if future.cancel():
+                    self.counts["dropped"] += 1
+                elif future.done() and future.exception() is None:
+                    self.counts["wasted"] += 1
+            self._entries.clear()
+            self._queue.clear()
+            self._cond.notify_all()
+
+    def _count(self, name: str):
+        with self._cond:
+            self.counts[name] += 1
+
+    def _enqueue(self, requests):
+        for func, args, *then in requests:
+            key = (func, tuple(args))
+            if key in self._entries or key in self._recent:
+                continue
+            self._entries[key] = (Future(), None)
+            self._queue.append((key, then[0] if then else None))
+            self.counts["scheduled"] += 1
+        if self._queue and self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="nba-prefetch", daemon=True)
+            self._thread.start()
+        self._cond.notify_all()
+
+    def _expire(self):
+        """Drops finished results that are past their expiry or beyond max_entries."""
+        now = time.monotonic()
+        done = [key for key, (_, expires) in self._entries.items() if expires is not None]
+        for i, key in enumerate(done):
+            if self._entries[key][1] < now or len(done) - i > self.max_entries:
+                del self._entries[key]
+                self.counts["wasted"] += 1
+
+    def _run(self):
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._closed or self._queue)
+                if self._closed:
+                    return
+            self._budget.acquire()
+            with self._cond:
+                # Low priority: only start while no foreground request is running.
+                self._cond.wait_for(lambda: self._closed or (self._queue and not self._foreground))
+                if self._closed:
+                    return
+                key, then = self._queue.popleft()
+                entry = self._entries.get(key)
+                if entry is None or not entry[0].set_running_or_notify_cancel():
+                    continue
+            future = entry[0]
+            func, args = key
+            try:
+                with telemetry.span("prefetch.fetch", func=func.__name__):
+                    result = func(*args)
+                follow_up = then(result) if then is not None else []
+            except Exception as e:
+                logger.debug("Prefetch of %s%s failed: %s", func.__name__, args, e)
+                future.set_exception(e)
+                with self._cond:
+                    self.counts["failed"] += 1
+                    if self._entries.get(key) is entry:
+                        del self._entries[key]
+                continue
+            future.set_result(result)
+            with self._cond:
+                self.counts["fetched"] += 1
+                if self._entries.get(key) is entry:
+                    self._entries[key] = (future, time.monotonic() + self.ttl)
+                    self._expire()
+                if not self._closed:
+                    self._enqueue(follow_up)
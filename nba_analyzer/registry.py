@@ -0,0 +1,58 @@
+"""Compact player and team records.
+
+nba_api's static data returns a fresh dict per player on every call. The
+registry converts them once into __slots__ records, which take a fraction of
+a dict's memory and are shared by every index and cache. Records still
+support the dict-style access the rest of the code uses (``player["id"]``,
+``team.get("abbreviation")``).
+"""
+
+import sys
+
+from nba_api.stats.static import players, teams
+
+
+class Record:
+    """A fixed-field record with read-only dict-style access."""
+
+    __slots__ = ()
+
+    def __init__(self, **fields):
+        for key in self.__slots__:
+            value = fields.get(key)
+            object.__setattr__(self, key, sys.intern(value) if isinstance(value, str) else value)
+
+    def __getitem__(self, key: str):
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def get(self, key: str, default=None):
+        return getattr(self, key, default)
+
+    def keys(self) -> tuple[str, ...]:
+        return self.__slots__
+
+    def __setattr__(self, key, value):
+        raise AttributeError(f"{type(self).__name__} records are read-only")
+
+    def __repr__(self):
+        return f"{type(self).__name__}({', '.join(f'{k}={getattr(self, k)!r}' for k in self.__slots__)})"
+
+
+class Player(Record):
+    __slots__ = ("id", "full_name", "first_name", "last_name", "is_active")
+
+
+class Team(Record):
+    __slots__ = ("id", "full_name", "abbreviation", "nickname", "city", "state", "year_founded")
+
+
+def load_players() -> list[Player]:
+    """Converts nba_api's static player list to Player records."""
+    return [Player(**p) for p in players.get_players()]
+
+def load_teams() -> list[Team]:
+    """Converts nba_api's static team list to Team records."""
+    return [Team(**t) for t in teams.get_teams()]
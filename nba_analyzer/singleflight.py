@@ -0,0 +1,63 @@
+"""Coalescing of duplicate in-flight calls.
+
+When several threads ask for the same key at once (a double-clicked button,
+two tabs, batch workers overlapping), only the first runs the call; the
+others wait for it and receive the same result or exception. Nothing is
+remembered once the call finishes, so errors are not cached and later calls
+run again (caching is the response cache's job).
+"""
+
+import threading
+from concurrent.futures import CancelledError, Future
+
+
+class SingleFlight:
+    """Runs at most one call per key at a time, sharing its outcome with concurrent callers."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}  # key -> Future of the in-flight call
+        self.calls = 0
+        self.coalesced = 0
+
+    def do(self, key, func, timeout: float | None = None) -> tuple[object, bool]:
+        """
+        Returns (func(), shared), where `shared` is True if the result came from another
+        caller's in-flight call. Waiters give up with TimeoutError after `timeout` seconds
+        (the call itself carries on). If the running call is interrupted (e.g. KeyboardInterrupt
+        in its thread), a waiter takes over and runs func itself.
+        """
+        while True:
+            with self._lock:
+                future = self._calls.get(key)
+                leader = future is None
+                if leader:
+                    future = self._calls[key] = Future()
+                    self.calls += 1
+                else:
+                    self.coalesced += 1
+            if leader:
+                break
+            try:
+                return future.result(timeout), True
+            except CancelledError:
+                continue
+        try:
+            result = func()
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        except BaseException:
+            future.cancel()
+            raise
+        else:
+            future.set_result(result)
+            return result, False
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+    def in_flight(self) -> int:
+        """Number of calls currently running."""
+        with self._lock:
+            return len(self._calls)
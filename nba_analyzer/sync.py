@@ -0,0 +1,145 @@
+"""Incremental game-log sync.
+
+Game logs are kept per player-season in a local SQLite store. Syncing a
+season that is already stored only requests games from the last stored
+GAME_DATE onward (via PlayerGameLog's DateFrom parameter) and merges them
+in by Game_ID, so nightly refreshes transfer a few rows instead of a season.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+from datetime import datetime
+from functools import partial
+
+import pandas as pd
+
+from . import analysis, api, cache
+
+DEFAULT_PATH = os.path.join(os.path.dirname(cache.DEFAULT_PATH), "gamelogs.sqlite3")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS games (
+    player_id INTEGER NOT NULL,
+    season TEXT NOT NULL,
+    game_id TEXT NOT NULL,
+    game_date TEXT NOT NULL,
+    row TEXT NOT NULL,
+    PRIMARY KEY (player_id, season, game_id)
+);
+CREATE TABLE IF NOT EXISTS syncs (
+    player_id INTEGER NOT NULL,
+    season TEXT NOT NULL,
+    synced_on TEXT NOT NULL,
+    PRIMARY KEY (player_id, season)
+);
+"""
+
+
+class GameLogStore:
+    """A local store of raw PlayerGameLog rows, one per player, season and game."""
+
+    def __init__(self, path: str = DEFAULT_PATH):
+        self.path = path
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+
+    def last_game_date(self, player_id: int, season: str) -> str | None:
+        """Returns the ISO date of the latest stored game, or None if nothing is stored."""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT MAX(game_date) FROM games WHERE player_id = ? AND season = ?",
+                (player_id, season),
+            ).fetchone()[0]
+
+    def last_synced(self, player_id: int, season: str) -> str | None:
+        """Returns the ISO date the player-season was last synced, or None."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT synced_on FROM syncs WHERE player_id = ? AND season = ?", (player_id, season)
+            ).fetchone()
+        return row[0] if row else None
+
+    def mark_synced(self, player_id: int, season: str):
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO syncs VALUES (?, ?, ?)",
+                (player_id, season, datetime.now().strftime("%Y-%m-%d")),
+            )
+
+    def load(self, player_id: int, season: str) -> pd.DataFrame:
+        """Returns the stored game log, newest game first like the API."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT row FROM games WHERE player_id = ? AND season = ? "
+                "ORDER BY game_date DESC, game_id DESC",
+                (player_id, season),
+            ).fetchall()
+        return analysis.compact(pd.DataFrame.from_records([json.loads(row) for row, in rows]))
+
+    def save(self, player_id: int, season: str, df: pd.DataFrame) -> int:
+        """Merges game rows into the store, replacing any with the same Game_ID. Returns rows written."""
+        if df.empty:
+            return 0
+        game_dates = pd.to_datetime(df["GAME_DATE"], format=analysis.GAME_DATE_FORMAT)
+        dates = game_dates.dt.strftime("%Y-%m-%d")
+        # Rows keep the API's date format, as stored before frames were compacted.
+        api_dates = game_dates.dt.strftime(analysis.GAME_DATE_FORMAT).str.upper()
+        records = df.assign(GAME_DATE=api_dates).to_json(orient="records")
+        values = [
+            (player_id, season, str(game_id), date, json.dumps(record))
+            for game_id, date, record in zip(df["Game_ID"], dates, json.loads(records))
+        ]
+        with self._lock:
+            self._conn.executemany("INSERT OR REPLACE INTO games VALUES (?, ?, ?, ?, ?)", values)
+        return len(values)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+_default_store = None
+
+def get_store() -> GameLogStore:
+    """Returns the default on-disk game-log store, creating it on first use."""
+    global _default_store
+    if _default_store is None:
+        _default_store = GameLogStore()
+    return _default_store
+
+def sync_player_season(player_id: int, season: str, store: GameLogStore | None = None) -> pd.DataFrame:
+    """
+    Brings the stored game log for a player-season up to date and returns it.
+    Seasons last synced after they finished are returned without a request.
+    """
+    store = store or get_store()
+    synced_on = store.last_synced(player_id, season)
+    season_over = analysis.season_end(season).strftime("%Y-%m-%d")
+    if synced_on is not None and synced_on >= season_over:
+        return store.load(player_id, season)
+    last = store.last_game_date(player_id, season)
+    # Re-request the last stored day too, in case its row was corrected.
+    date_from = "" if last is None else datetime.strptime(last, "%Y-%m-%d").strftime("%m/%d/%Y")
+    new_games = api.get_player_game_log(player_id, season, date_from=date_from)
+    store.save(player_id, season, new_games)
+    store.mark_synced(player_id, season)
+    return store.load(player_id, season)
+
+def sync_active_players(season: str | None = None, store: GameLogStore | None = None,
+                        max_workers: int = 4, progress=None) -> int:
+    """
+    Syncs the given season (default: current) for every active player concurrently.
+    `progress` is called as progress(done, total, player_id, season, error).
+    Returns the number of player-seasons synced successfully.
+    """
+    season = season or analysis.current_season()
+    store = store or get_store()
+    jobs = [(p["id"], season) for p in api.get_active_players()]
+    synced = api.fetch_concurrently(partial(sync_player_season, store=store), jobs, max_workers, progress)
+    return len(synced)
@@ -0,0 +1,174 @@
+"""Lightweight timing telemetry for API calls, analysis steps and UI renders.
+
+Code under measurement opens a span::
+
+    with telemetry.span("api.request", endpoint="playergamelog") as s:
+        ...
+        s["bytes"] = len(body)
+
+Finished spans are kept in memory (bounded) with their duration and any
+fields set on them (bytes, rows, cache hit/miss, ...). summary() reports
+p50/p95/p99 latency per span name, and export() writes everything to a JSON
+or CSV file. An optional sampling profiler records which functions threads
+were in, for finding where latency goes inside a slow span.
+
+Set NBA_ANALYZER_TELEMETRY=<path.json|path.csv> to export on exit, and
+NBA_ANALYZER_PROFILE=1 to run the sampling profiler for the whole session.
+Finished spans are also logged at DEBUG on this module's logger, so the
+structured log (see logs) carries the same timings.
+"""
+
+import atexit
+import csv
+import functools
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from collections import Counter, defaultdict, deque
+from contextlib import contextmanager
+
+from . import logs
+
+MAX_SPANS = 10_000
+
+_lock = threading.Lock()
+_spans = deque(maxlen=MAX_SPANS)
+_durations = defaultdict(lambda: deque(maxlen=MAX_SPANS))
+_profiler = None
+_log = logging.getLogger(__name__)
+
+
+@contextmanager
+def span(name: str, **fields):
+    """Times the enclosed block; fields set on the yielded dict are recorded with it."""
+    record = dict(fields)
+    start = time.perf_counter()
+    try:
+        yield record
+    except BaseException as e:
+        record["error"] = type(e).__name__
+        raise
+    finally:
+        duration = time.perf_counter() - start
+        record.update(name=name, start=time.time() - duration, duration_ms=duration * 1000,
+                      thread=threading.current_thread().name)
+        with _lock:
+            _spans.append(record)
+            _durations[name].append(duration * 1000)
+        if _log.isEnabledFor(logging.DEBUG):
+            _log.debug("%s took %.1f ms", name, duration * 1000,
+                       extra={"span": name, **logs.extra_fields({k: v for k, v in record.items() if k != "start"})})
+
+def timed(name: str):
+    """Decorator recording a span per call, with the result's row count if it has one."""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with span(name) as s:
+                result = func(*args, **kwargs)
+                if hasattr(result, "__len__"):
+                    s["rows"] = len(result)
+                return result
+        return wrapper
+    return decorator
+
+def spans(name: str | None = None) -> list[dict]:
+    """Returns recorded spans, optionally only those with the given name."""
+    with _lock:
+        return [dict(s) for s in _spans if name is None or s["name"] == name]
+
+def _percentile(ordered: list[float], q: float) -> float:
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+def summary() -> dict:
+    """Returns count and p50/p95/p99/max duration in ms per span name, plus cache hit rates."""
+    with _lock:
+        durations = {name: sorted(values) for name, values in _durations.items()}
+        hits = Counter(s["name"] for s in _spans if s.get("cache") == "hit")
+        lookups = Counter(s["name"] for s in _spans if "cache" in s)
+    result = {}
+    for name, ordered in durations.items():
+        result[name] = {
+            "count": len(ordered),
+            "p50_ms": _percentile(ordered, 0.50),
+            "p95_ms": _percentile(ordered, 0.95),
+            "p99_ms": _percentile(ordered, 0.99),
+            "max_ms": ordered[-1],
+        }
+        if lookups[name]:
+            result[name]["cache_hit_rate"] = hits[name] / lookups[name]
+    return result
+
+def reset():
+    """Discards all recorded spans."""
+    with _lock:
+        _spans.clear()
+        _durations.clear()
+
+def export(path: str):
+    """Writes spans to a CSV file, or spans, summary and profile samples to a JSON file."""
+    recorded = spans()
+    if path.endswith(".csv"):
+        columns = ["name", "start", "duration_ms", "thread"]
+        columns += sorted({key for s in recorded for key in s} - set(columns))
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=columns)
+            writer.writeheader()
+            writer.writerows(recorded)
+        return
+    report = {"summary": summary(), "spans": recorded}
+    if _profiler is not None:
+        report["profile"] = _profiler.top()
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2, default=str)
+
+
+class SamplingProfiler:
+    """Samples every thread's current stack at a fixed interval and counts functions seen."""
+
+    def __init__(self, interval: float = 0.005):
+        self.interval = interval
+        self.samples = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="telemetry-profiler", daemon=True)
+
+    def _run(self):
+        own = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            for ident, frame in sys._current_frames().items():
+                if ident == own:
+                    continue
+                seen = set()
+                while frame is not None:
+                    code = frame.f_code
+                    seen.add(f"{code.co_filename}:{code.co_firstlineno}({code.co_name})")
+                    frame = frame.f_back
+                # Count each function once per sample, so the total is time spent inside it.
+                self.samples.update(seen)
+
+    def top(self, n: int = 50) -> list[tuple[str, int]]:
+        """Returns the n functions seen in the most samples."""
+        return self.samples.most_common(n)
+
+def start_profiler(interval: float = 0.005) -> SamplingProfiler:
+    """Starts the sampling profiler (if not already running) and returns it."""
+    global _profiler
+    if _profiler is None or _profiler._stop.is_set():
+        _profiler = SamplingProfiler(interval)
+        _profiler._thread.start()
+    return _profiler
+
+def stop_profiler() -> SamplingProfiler | None:
+    """Stops the sampling profiler; its samples stay available for export."""
+    if _profiler is not None:
+        _profiler._stop.set()
+    return _profiler
+
+
+if os.environ.get("NBA_ANALYZER_PROFILE"):
+    start_profiler()
+if os.environ.get("NBA_ANALYZER_TELEMETRY"):
+    atexit.register(export, os.environ["NBA_ANALYZER_TELEMETRY"])
@@ -0,0 +1,54 @@
+"""Rate limiting and retry helpers for calls to stats.nba.com."""
+
+import random
+import threading
+import time
+
+
+class RateLimitedError(ConnectionError):
+    """Raised when stats.nba.com answers with HTTP 429 Too Many Requests."""
+
+
+class TokenBucket:
+    """A thread-safe token bucket allowing `rate` calls per second with bursts of `capacity`."""
+
+    def __init__(self, rate: float, capacity: int = 1):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self):
+        """Blocks until a token is available, then consumes it."""
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+    def pause(self, seconds: float):
+        """Withholds tokens from every caller for at least `seconds`, e.g. after a 429."""
+        with self._lock:
+            self._refill()
+            self._tokens = min(self._tokens, -seconds * self.rate)
+
+
+def retry(func, attempts: int = 4, backoff: float = 1.0, max_backoff: float = 30.0,
+          retry_on=(OSError,)):
+    """Calls func(), retrying with jittered exponential backoff on the given exceptions."""
+    for attempt in range(attempts):
+        try:
+            return func()
+        except retry_on:
+            if attempt == attempts - 1:
+                raise
+            time.sleep(min(max_backoff, backoff * 2 ** attempt) * random.uniform(0.5, 1.0))
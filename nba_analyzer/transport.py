@@ -0,0 +1,89 @@
+"""Pooled HTTP transport for stats.nba.com endpoint calls.
+
+nba_api sends every request with a bare ``requests.get``, so each call opens
+(and TLS-negotiates) a new connection. SessionTransport keeps one
+``requests.Session`` whose connection pool is reused across calls and
+threads, with gzip, separate connect/read timeouts, retries on connection
+errors and 5xx responses, and a hook for rotating proxies per request. It is
+a drop-in for ``NBAStatsHTTP`` in api.set_transport().
+"""
+
+from __future__ import annotations
+
+import itertools
+import threading
+
+from .lazy import lazy_import
+
+requests = lazy_import("requests")
+stats_http = lazy_import("nba_api.stats.library.http")
+
+STATS_BASE_URL = "https://stats.nba.com/stats/{endpoint}"
+CONNECT_TIMEOUT = 3.05
+READ_TIMEOUT = 30.0
+# 429s are left to the caller, which pauses the shared rate limiter for every thread and
+# retries the job (see api._request and api.iter_concurrently).
+RETRY_STATUSES = (500, 502, 503, 504)
+
+
+class SessionTransport:
+    """Sends endpoint requests over a persistent, pooled requests.Session.
+
+    `proxies` may be a list of proxy URLs, used round-robin, or a callable
+    returning the proxy (or None) for each request. A proxy given by the
+    endpoint itself takes precedence.
+    """
+
+    def __init__(self, base_url: str = STATS_BASE_URL, pool_size: int = 8, connect_timeout: float = CONNECT_TIMEOUT,
+                 read_timeout: float = READ_TIMEOUT, retries: int = 3, backoff: float = 0.5, proxies=None,
+                 headers: dict | None = None, verify=True):
+        self.base_url = base_url
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.session = requests.Session()
+        self.session.verify = verify
+        self.session.headers.update(stats_http.NBAStatsHTTP.headers if headers is None else headers)
+        self.session.headers.update({"Accept-Encoding": "gzip, deflate", "Connection": "keep-alive"})
+        policy = requests.adapters.Retry(total=retries, backoff_factor=backoff, status_forcelist=RETRY_STATUSES,
+                             allowed_methods=("GET",), respect_retry_after_header=True,
+                             # Once retries run out the last 5xx is returned; api._request rejects it uncached.
+                             raise_on_status=False)
+        self.adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=pool_size, max_retries=policy)
+        self.session.mount("https://", self.adapter)
+        self.session.mount("http://", self.adapter)
+        self._proxies = itertools.cycle(proxies) if isinstance(proxies, (list, tuple)) and proxies else proxies
+        self._lock = threading.Lock()
+        self.requests = 0
+
+    def next_proxy(self) -> str | None:
+        """Returns the proxy for the next request, per the rotation policy."""
+        if self._proxies is None:
+            return None
+        if callable(self._proxies):
+            return self._proxies()
+        with self._lock:
+            return next(self._proxies)
+
+    @property
+    def connections(self) -> int:
+        """Number of connections opened so far across the pool."""
+        pools = self.adapter.poolmanager.pools
+        return sum(pools[key].num_connections for key in pools.keys())
+
+    def send_api_request(self, endpoint, parameters, proxy=None, headers=None, timeout=None, **kwargs):
+        """Sends one endpoint request and returns an NBAStatsResponse, like NBAStatsHTTP."""
+        proxy = proxy or self.next_proxy()
+        response = self.session.get(
+            self.base_url.format(endpoint=endpoint),
+            # Sorted like nba_api does; some endpoints depend on parameter order.
+            params=sorted(parameters.items()),
+            headers=headers,
+            proxies={"http": proxy, "https": proxy} if proxy else None,
+            timeout=(self.connect_timeout, timeout or self.read_timeout),
+        )
+        with self._lock:
+            self.requests += 1
+        return stats_http.NBAStatsResponse(response=response.text, status_code=response.status_code, url=response.url)
+
+    def close(self):
+        self.session.close()
@@ -1,49 +1,158 @@
 """GUI components for the NBA Data Analyzer."""
 
+from __future__ import annotations
+
+import itertools
+import logging
 import tkinter as tk
 from tkinter import ttk, messagebox
-import pandas as pd
-from . import api, analysis
+from . import api, analysis, charts, leaders, prefetch, telemetry, workers
+from .lazy import lazy_import
+
+pd = lazy_import("pandas")
+
+logger = logging.getLogger(__name__)
 
 class DataDisplayFrame(ttk.Frame):
-    """A reusable frame for displaying data in a scrollable Treeview table."""
-    def __init__(self, parent):
+    """A reusable frame for displaying data in a scrollable Treeview table.
+
+    Small tables are inserted directly. Larger ones are inserted in batches
+    scheduled with after() so the window keeps redrawing, and tables above
+    `virtual_threshold` rows switch to a virtual mode that only materializes
+    the visible window of rows (plus a buffer) and rewrites it on scroll.
+    """
+    def __init__(self, parent, virtual_threshold=5000, batch_size=500, buffer_rows=20):
         super().__init__(parent, padding=5)
+        self.virtual_threshold = virtual_threshold
+        self.batch_size = batch_size
+        self.buffer_rows = buffer_rows
         self.tree = ttk.Treeview(self, show="headings")
 
         # Scrollbars
-        ysb = ttk.Scrollbar(self, orient=tk.VERTICAL, command=self.tree.yview)
+        self.ysb = ttk.Scrollbar(self, orient=tk.VERTICAL)
         xsb = ttk.Scrollbar(self, orient=tk.HORIZONTAL, command=self.tree.xview)
-        self.tree.configure(yscrollcommand=ysb.set, xscrollcommand=xsb.set)
+        self.tree.configure(xscrollcommand=xsb.set)
 
         # Grid layout
         self.tree.grid(row=0, column=0, sticky="nsew")
-        ysb.grid(row=0, column=1, sticky="ns")
+        self.ysb.grid(row=0, column=1, sticky="ns")
         xsb.grid(row=1, column=0, sticky="ew")
         self.grid_rowconfigure(0, weight=1)
         self.grid_columnconfigure(0, weight=1)
 
+        self._rows = None  # Row values as a 2-D object array in virtual mode
+        self._offset = 0
+        self._pending = None  # after() id of the next batch insert
+        self._row_height = int(ttk.Style(self).lookup("Treeview", "rowheight") or 20)
+        self._set_virtual(False)
+
+        self.tree.bind("<Configure>", lambda e: self._render_window())
+        self.tree.bind("<MouseWheel>", self._on_mousewheel)
+        # X11 reports the wheel as buttons 4 (up) and 5 (down).
+        self.tree.bind("<Button-4>", self._on_mousewheel)
+        self.tree.bind("<Button-5>", self._on_mousewheel)
+
     def update_data(self, df: pd.DataFrame):
         """Clears the current view and populates it with new data from a DataFrame."""
-        self.tree.delete(*self.tree.get_children())
+        with telemetry.span("ui.render", rows=0 if df is None else len(df)):
+            if self._pending is not None:
+                self.after_cancel(self._pending)
+                self._pending = None
+            self.tree.delete(*self.tree.get_children())
+            self._rows = None
+            self._set_virtual(False)
+
+            if df is None or df.empty:
+                return
+
+            self.tree["columns"] = list(df.columns)
+            self.tree["displaycolumns"] = list(df.columns)
 
-        if df is None or df.empty:
+            for col in df.columns:
+                self.tree.heading(col, text=col)
+                self.tree.column(col, width=100, anchor="center")
+
+            # Show dates without a midnight time component
+            dates = df.select_dtypes(include="datetime").columns
+            if len(dates):
+                df = df.assign(**{col: df[col].dt.strftime("%Y-%m-%d") for col in dates})
+
+            if len(df) > self.virtual_threshold:
+                self._rows = df.to_numpy(dtype=object)
+                self._offset = 0
+                self._set_virtual(True)
+                self._render_window()
+            else:
+                self._insert_batch(df.itertuples(index=False, name=None))
+
+    def _set_virtual(self, virtual: bool):
+        """Points the vertical scrollbar at either the Treeview or the virtual window."""
+        if virtual:
+            self.tree.configure(yscrollcommand="")
+            self.ysb.configure(command=self.yview)
+        else:
+            self.tree.configure(yscrollcommand=self.ysb.set)
+            self.ysb.configure(command=self.tree.yview)
+
+    def _insert_batch(self, rows):
+        """Inserts the next batch of rows and schedules the rest, keeping the UI responsive."""
+        with telemetry.span("ui.insert_batch") as batch_span:
+            inserted = 0
+            for values in itertools.islice(rows, self.batch_size):
+                self.tree.insert("", tk.END, values=values)
+                inserted += 1
+            batch_span["rows"] = inserted
+        self._pending = self.after(1, self._insert_batch, rows) if inserted == self.batch_size else None
+
+    def _visible_rows(self) -> int:
+        return max(1, self.tree.winfo_height() // self._row_height)
+
+    def _render_window(self):
+        """Fills the materialized rows with the data window starting at the current offset."""
+        if self._rows is None:
             return
+        total = len(self._rows)
+        visible = self._visible_rows()
+        self._offset = max(0, min(self._offset, total - visible))
+        window = self._rows[self._offset:self._offset + visible + self.buffer_rows]
 
-        self.tree["columns"] = list(df.columns)
-        self.tree["displaycolumns"] = list(df.columns)
+        items = self.tree.get_children()
+        if len(items) > len(window):
+            self.tree.delete(*items[len(window):])
+        for item, values in zip(items, window):
+            self.tree.item(item, values=list(values))
+        for values in window[len(items):]:
+            self.tree.insert("", tk.END, values=list(values))
+        self.tree.yview_moveto(0)
+        self.ysb.set(self._offset / total, min(1.0, (self._offset + visible) / total))
 
-        for col in df.columns:
-            self.tree.heading(col, text=col)
-            self.tree.column(col, width=100, anchor="center")
+    def yview(self, *args):
+        """Scrollbar command for virtual mode: 'moveto', fraction or 'scroll', n, 'units'/'pages'."""
+        if self._rows is None:
+            return self.tree.yview(*args)
+        if args[0] == "moveto":
+            self._offset = int(float(args[1]) * len(self._rows))
+        elif args[0] == "scroll":
+            step = self._visible_rows() if args[2] == "pages" else 1
+            self._offset += int(args[1]) * step
+        self._render_window()
 
-        for _, row in df.iterrows():
-            self.tree.insert("", tk.END, values=list(row))
+    def _on_mousewheel(self, event):
+        """Scrolls the virtual window; outside virtual mode the Treeview scrolls itself."""
+        if self._rows is None:
+            return
+        up = event.num == 4 or (event.num != 5 and event.delta > 0)
+        self.yview("scroll", -3 if up else 3, "units")
+        return "break"
 
 class TeamAnalysisTab(ttk.Frame):
     """GUI Tab for Team Analysis."""
-    def __init__(self, parent):
+    CHART_PANELS = [("Win % by season", [("WIN_PCT", "Win %")], (0, 1))]
+
+    def __init__(self, parent, runner: workers.TaskRunner, prefetcher: prefetch.Prefetcher | None = None):
         super().__init__(parent)
+        self.runner = runner
+        self.prefetcher = prefetcher
 
         # --- Controls ---
         controls_frame = ttk.LabelFrame(self, text="Team Selection", padding=10)
@@ -55,33 +164,71 @@ class TeamAnalysisTab(ttk.Frame):
         self.team_selector.pack(side=tk.LEFT)
         self.team_selector.bind("<<ComboboxSelected>>", self.load_team_data)
 
-        # --- Data Display ---
-        self.data_frame = DataDisplayFrame(self)
-        self.data_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        self.progress = ttk.Progressbar(controls_frame, mode="indeterminate", length=120)
+        self.progress.pack(side=tk.RIGHT)
+
+        # --- Chart and Data Display ---
+        panes = ttk.PanedWindow(self, orient=tk.VERTICAL)
+        panes.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        self.chart = charts.TrendChart(panes, self.CHART_PANELS)
+        self.data_frame = DataDisplayFrame(panes)
+        panes.add(self.chart, weight=1)
+        panes.add(self.data_frame, weight=1)
 
     def load_team_data(self, event=None):
         team_name = self.team_selector.get()
-        try:
-            team_id = api.get_team_id(team_name)
+        self.progress.start()
+        self.runner.submit(self, lambda: self.fetch_team_data(team_name, self.prefetcher),
+                           self.show_team_data, self.show_error)
+
+    @staticmethod
+    def fetch_team_data(team_name: str, prefetcher: prefetch.Prefetcher | None = None) -> pd.DataFrame:
+        """
+        Fetches and processes a team's data. Runs on a worker thread.
+        With a prefetcher, the team's current roster and their game logs are then loaded in the background.
+        """
+        team_id = api.get_team_id(team_name)
+        if prefetcher is None:
             raw_stats_df = api.get_team_yearly_stats(team_id)
-            display_df = analysis.get_team_win_loss_trend(raw_stats_df)
-            self.data_frame.update_data(display_df)
-        except Exception as e:
-            messagebox.showerror("Error", f"Could not load team data: {e}")
-            self.data_frame.update_data(pd.DataFrame())
+        else:
+            raw_stats_df = prefetcher.get(api.get_team_yearly_stats, team_id)
+            prefetcher.schedule(prefetch.after_team(team_id))
+        return analysis.get_team_win_loss_trend(raw_stats_df)
+
+    def show_team_data(self, display_df: pd.DataFrame):
+        self.progress.stop()
+        self.data_frame.update_data(display_df)
+        start_years = display_df["YEAR"].astype(str).str[:4].astype(int).to_numpy()
+        self.chart.update_chart(start_years, display_df)
+
+    def show_error(self, error: Exception):
+        self.progress.stop()
+        messagebox.showerror("Error", f"Could not load team data: {error}")
+        self.data_frame.update_data(pd.DataFrame())
+        self.chart.clear()
 
 class PlayerAnalysisTab(ttk.Frame):
     """GUI Tab for Player Game Log Analysis."""
-    def __init__(self, parent):
+    TREND_WINDOW = 10
+    CHART_PANELS = [
+        (f"Points per game, last {TREND_WINDOW}", [(f"PTS_LAST{TREND_WINDOW}", "PTS")], None),
+        (f"Shooting, last {TREND_WINDOW}", [(f"FG_PCT_LAST{TREND_WINDOW}", "FG%"),
+                                            (f"FG3_PCT_LAST{TREND_WINDOW}", "3P%"),
+                                            (f"FT_PCT_LAST{TREND_WINDOW}", "FT%")], (0, 1)),
+    ]
+
+    def __init__(self, parent, runner: workers.TaskRunner, prefetcher: prefetch.Prefetcher | None = None):
         super().__init__(parent)
+        self.runner = runner
+        self.prefetcher = prefetcher
 
         # --- Controls ---
         controls_frame = ttk.LabelFrame(self, text="Player Selection", padding=10)
         controls_frame.pack(fill=tk.X, padx=5, pady=5)
 
         ttk.Label(controls_frame, text="Player:").pack(side=tk.LEFT, padx=(0, 5))
-        player_names = sorted([p["full_name"] for p in api.get_active_players()])
-        self.player_combo = ttk.Combobox(controls_frame, values=player_names, width=25)
+        # Active player names are filled in when the dropdown is first opened
+        self.player_combo = ttk.Combobox(controls_frame, width=25, postcommand=self.load_player_names)
         self.player_combo.pack(side=tk.LEFT, padx=5)
 
         ttk.Label(controls_frame, text="Season:").pack(side=tk.LEFT, padx=5)
@@ -92,9 +239,20 @@ class PlayerAnalysisTab(ttk.Frame):
 
         ttk.Button(controls_frame, text="Get Stats", command=self.load_player_data).pack(side=tk.LEFT, padx=5)
 
-        # --- Data Display ---
-        self.data_frame = DataDisplayFrame(self)
-        self.data_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        self.progress = ttk.Progressbar(controls_frame, mode="indeterminate", length=120)
+        self.progress.pack(side=tk.RIGHT)
+
+        # --- Chart and Data Display ---
+        panes = ttk.PanedWindow(self, orient=tk.VERTICAL)
+        panes.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        self.chart = charts.TrendChart(panes, self.CHART_PANELS, dates=True)
+        self.data_frame = DataDisplayFrame(panes)
+        panes.add(self.chart, weight=1)
+        panes.add(self.data_frame, weight=1)
+
+    def load_player_names(self):
+        if not self.player_combo['values']:
+            self.player_combo['values'] = sorted([p["full_name"] for p in api.get_active_players()])
 
     def load_player_data(self):
         player_name = self.player_combo.get()
@@ -104,22 +262,136 @@ class PlayerAnalysisTab(ttk.Frame):
             messagebox.showwarning("Input Required", "Please select a player and a season.")
             return
 
-        try:
-            player_info = api.find_player(player_name)
+        self.progress.start()
+        self.runner.submit(self, lambda: self.fetch_player_data(player_name, season, self.prefetcher),
+                           self.show_player_data, self.show_error)
+
+    @staticmethod
+    def fetch_player_data(player_name: str, season: str,
+                          prefetcher: prefetch.Prefetcher | None = None) -> pd.DataFrame:
+        """
+        Fetches and processes a player's game log. Runs on a worker thread.
+        With a prefetcher, the player's adjacent seasons are then loaded in the background.
+        """
+        player_info = api.find_player(player_name)
+        if prefetcher is None:
             raw_log_df = api.get_player_game_log(player_info['id'], season)
-            processed_df = analysis.process_player_gamelog(raw_log_df)
+        else:
+            raw_log_df = prefetcher.get(api.get_player_game_log, player_info['id'], season)
+            prefetcher.schedule(prefetch.after_player_season(player_info['id'], season))
+        processed_df = analysis.process_player_gamelog(raw_log_df)
+
+        # Select and reorder columns for better readability
+        cols_to_show = [
+            'GAME_DATE', 'MATCHUP', 'LOCATION', 'WL', 'PTS', 'REB', 'AST', 'STL', 'BLK', 'FGM', 'FGA', 'FG_PCT',
+            'FG3M', 'FG3A', 'FG3_PCT', 'FTM', 'FTA', 'FT_PCT', 'MIN'
+        ]
+        return processed_df[[c for c in cols_to_show if c in processed_df.columns]]
+
+    def show_player_data(self, display_df: pd.DataFrame):
+        self.progress.stop()
+        self.data_frame.update_data(display_df)
+        if display_df.empty:
+            self.chart.clear()
+            return
+        trends = analysis.player_trends(display_df, self.TREND_WINDOW)
+        self.chart.update_chart(trends["GAME_DATE"].to_numpy(), trends)
+
+    def show_error(self, error: Exception):
+        self.progress.stop()
+        messagebox.showerror("Error", f"Could not load player data: {error}")
+        self.data_frame.update_data(pd.DataFrame())
+        self.chart.clear()
+
+class LeadersTab(ttk.Frame):
+    """GUI Tab for league leaders over a range of seasons."""
+    RANKINGS = {"Single seasons": False, "Combined over range": True}
+
+    def __init__(self, parent, runner: workers.TaskRunner):
+        super().__init__(parent)
+        self.runner = runner
+        self.table = leaders.LeadersTable()
+
+        # --- Controls ---
+        controls_frame = ttk.LabelFrame(self, text="League Leaders", padding=10)
+        controls_frame.pack(fill=tk.X, padx=5, pady=5)
+
+        seasons = analysis.generate_seasons_list()
+        ttk.Label(controls_frame, text="Stat:").pack(side=tk.LEFT, padx=(0, 5))
+        self.stat_combo = ttk.Combobox(controls_frame, values=leaders.CATEGORIES, width=8, state="readonly")
+        self.stat_combo.set("PTS")
+        self.stat_combo.pack(side=tk.LEFT, padx=5)
+
+        ttk.Label(controls_frame, text="From:").pack(side=tk.LEFT, padx=5)
+        self.from_combo = ttk.Combobox(controls_frame, values=seasons, width=8, state="readonly")
+        self.from_combo.set(seasons[0])
+        self.from_combo.pack(side=tk.LEFT, padx=5)
+
+        ttk.Label(controls_frame, text="To:").pack(side=tk.LEFT, padx=5)
+        self.to_combo = ttk.Combobox(controls_frame, values=seasons, width=8, state="readonly")
+        self.to_combo.set(seasons[0])
+        self.to_combo.pack(side=tk.LEFT, padx=5)
+
+        ttk.Label(controls_frame, text="Top:").pack(side=tk.LEFT, padx=5)
+        self.top_spin = ttk.Spinbox(controls_frame, from_=1, to=100, width=4, command=self.refresh)
+        self.top_spin.set(10)
+        self.top_spin.pack(side=tk.LEFT, padx=5)
+
+        self.ranking_combo = ttk.Combobox(controls_frame, values=list(self.RANKINGS), width=18, state="readonly")
+        self.ranking_combo.set("Single seasons")
+        self.ranking_combo.pack(side=tk.LEFT, padx=5)
 
-            # Select and reorder columns for better readability
-            cols_to_show = [
-                'GAME_DATE', 'MATCHUP', 'LOCATION', 'WL', 'PTS', 'REB', 'AST', 'STL', 'BLK', 'FGM', 'FGA', 'FG_PCT',
-                'FG3M', 'FG3A', 'FG3_PCT', 'FTM', 'FTA', 'FT_PCT', 'MIN'
-            ]
-            display_df = processed_df[[c for c in cols_to_show if c in processed_df.columns]]
-            self.data_frame.update_data(display_df)
+        self.per_game = tk.BooleanVar(value=False)
+        ttk.Checkbutton(controls_frame, text="Per game", variable=self.per_game,
+                        command=self.refresh).pack(side=tk.LEFT, padx=5)
 
-        except Exception as e:
-            messagebox.showerror("Error", f"Could not load player data: {e}")
-            self.data_frame.update_data(pd.DataFrame())
+        ttk.Button(controls_frame, text="Show Leaders", command=self.load_leaders).pack(side=tk.LEFT, padx=5)
+
+        self.progress = ttk.Progressbar(controls_frame, mode="indeterminate", length=120)
+        self.progress.pack(side=tk.RIGHT)
+
+        for combo in (self.stat_combo, self.from_combo, self.to_combo, self.ranking_combo):
+            combo.bind("<<ComboboxSelected>>", lambda e: self.refresh())
+
+        # --- Data Display ---
+        self.data_frame = DataDisplayFrame(self)
+        self.data_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+
+    def selected_seasons(self) -> list[str]:
+        first, last = sorted([self.from_combo.get(), self.to_combo.get()])
+        return [s for s in analysis.generate_seasons_list() if first <= s <= last]
+
+    def query(self) -> pd.DataFrame:
+        """Ranks the loaded leaders for the current selection."""
+        try:
+            n = max(1, int(self.top_spin.get()))
+        except ValueError:
+            n = 10
+        return self.table.top(self.stat_combo.get(), self.selected_seasons(), n=n,
+                              career=self.RANKINGS[self.ranking_combo.get()], per_game=self.per_game.get())
+
+    def refresh(self):
+        """Re-ranks immediately when everything selected is already loaded."""
+        if not self.table.missing(self.selected_seasons(), [self.stat_combo.get()]):
+            self.data_frame.update_data(self.query())
+
+    def load_leaders(self):
+        seasons, stat = self.selected_seasons(), self.stat_combo.get()
+        if not self.table.missing(seasons, [stat]):
+            self.refresh()
+            return
+        self.progress.start()
+        self.runner.submit(self, lambda: self.table.load(seasons, [stat]), self.show_leaders, self.show_error)
+
+    def show_leaders(self, result=None):
+        self.progress.stop()
+        self.data_frame.update_data(self.query())
+
+    def show_error(self, error: Exception):
+        self.progress.stop()
+        messagebox.showerror("Error", f"Could not load league leaders: {error}")
+        # Show whatever seasons did load.
+        self.data_frame.update_data(self.query())
 
 class MainApplication(tk.Tk):
     """The main application window."""
@@ -127,18 +399,30 @@ class MainApplication(tk.Tk):
         super().__init__()
         self.title("NBA Data Analyzer")
         self.geometry("1200x700")
+        self.runner = workers.TaskRunner(self)
+        # Shared by the tabs, so e.g. a team's roster logs serve the player tab.
+        self.prefetcher = prefetch.Prefetcher()
+        self.protocol("WM_DELETE_WINDOW", self.close)
 
         # Create a Notebook (tab container)
         notebook = ttk.Notebook(self)
         notebook.pack(fill="both", expand=True, padx=10, pady=10)
 
         # Create tabs
-        team_tab = TeamAnalysisTab(notebook)
-        player_tab = PlayerAnalysisTab(notebook)
+        team_tab = TeamAnalysisTab(notebook, self.runner, self.prefetcher)
+        player_tab = PlayerAnalysisTab(notebook, self.runner, self.prefetcher)
+        leaders_tab = LeadersTab(notebook, self.runner)
 
         # Add tabs to the notebook
         notebook.add(team_tab, text="Team Analysis")
         notebook.add(player_tab, text="Player Game Logs")
+        notebook.add(leaders_tab, text="League Leaders")
+
+    def close(self):
+        self.runner.shutdown()
+        self.prefetcher.close()
+        logger.info("Prefetch stats: %s", self.prefetcher.stats())
+        self.destroy()
 
 def start_app():
     """Initializes and runs the main application."""
@@ -0,0 +1,130 @@
+"""Local columnar store of fetched NBA data.
+
+Fetched frames are written as Parquet files partitioned Hive-style by season
+or team, e.g. ``player_game_logs/SEASON=2015-16/2544.parquet``. Queries read
+the whole dataset with predicate pushdown (``filters``) and column pruning
+(``columns``) through pyarrow, with memory-mapped reads, so cross-season
+questions run against the local copy instead of hundreds of API calls::
+
+    Warehouse().query("player_game_logs", columns=["Player_ID", "GAME_DATE", "PTS"],
+                      filters=[("LOCATION", "==", "Home"), ("PTS", ">=", 30), ("SEASON", ">=", "2015-16")])
+"""
+
+from __future__ import annotations
+
+import os
+import tempfile
+from datetime import datetime
+
+from . import analysis, cache
+from .lazy import lazy_import
+
+pa = lazy_import("pyarrow")
+pd = lazy_import("pandas")
+
+DEFAULT_ROOT = os.path.join(os.path.dirname(cache.DEFAULT_PATH), "warehouse")
+
+# dataset -> partition column
+PLAYER_GAME_LOGS = "player_game_logs"
+TEAM_YEARLY_STATS = "team_yearly_stats"
+LEAGUE_LEADERS = "league_leaders"
+PARTITIONS = {
+    PLAYER_GAME_LOGS: "SEASON",
+    TEAM_YEARLY_STATS: "TEAM_ID",
+    LEAGUE_LEADERS: "SEASON",
+}
+# Text columns of the stored endpoints; any other column with no values in a file is a stat.
+TEXT_COLUMNS = frozenset({
+    "SEASON_ID", "Game_ID", "GAME_DATE", "MATCHUP", "WL",  # Player game logs
+    "TEAM_CITY", "TEAM_NAME", "YEAR", "NBA_FINALS_APPEARANCE",  # Team yearly stats
+    "PLAYER", "TEAM",  # League leaders
+})
+
+
+def _normalize(df: pd.DataFrame) -> pd.DataFrame:
+    """Gives every file the same column types so partitions can be read as one dataset.
+
+    Parquet dictionary-encodes repeated strings on disk, so categoricals are
+    stored as plain strings and numbers at full width. A column with no values
+    (e.g. PLUS_MINUS before it was tracked) would get Parquet's null type,
+    which can't be read together with other files, so stats become float64
+    here and text columns are typed as strings by _schema.
+    """
+    df = df.copy()
+    for col in df.columns:
+        dtype = df[col].dtype
+        if df[col].isna().all() and col not in TEXT_COLUMNS:
+            df[col] = df[col].astype("float64")
+        elif isinstance(dtype, pd.CategoricalDtype):
+            df[col] = df[col].astype(object)
+        elif pd.api.types.is_integer_dtype(dtype):
+            df[col] = df[col].astype("int64")
+        elif pd.api.types.is_float_dtype(dtype):
+            df[col] = df[col].astype("float64")
+    return df
+
+def _schema(df: pd.DataFrame) -> pa.Schema:
+    """Returns the Arrow schema for a normalized frame, with empty text columns typed as strings."""
+    schema = pa.Schema.from_pandas(df, preserve_index=False)
+    fields = [field.with_type(pa.string()) if pa.types.is_null(field.type) else field for field in schema]
+    return pa.schema(fields, metadata=schema.metadata)
+
+
+class Warehouse:
+    """A directory of Parquet datasets, one file per fetched entity and partition."""
+
+    def __init__(self, root: str = DEFAULT_ROOT):
+        self.root = root
+
+    def path(self, dataset: str, partition, name) -> str:
+        return os.path.join(self.root, dataset, f"{PARTITIONS[dataset]}={partition}", f"{name}.parquet")
+
+    def exists(self, dataset: str, partition, name, since: datetime | None = None) -> bool:
+        """Returns True if the entity has been written, and if `since` is given, last written at or after it."""
+        try:
+            modified = os.path.getmtime(self.path(dataset, partition, name))
+        except OSError:
+            return False
+        return since is None or modified >= since.timestamp()
+
+    def write(self, dataset: str, partition, name, df: pd.DataFrame):
+        """Atomically writes (or replaces) one entity's rows in a partition."""
+        if df.empty:
+            return
+        path = self.path(dataset, partition, name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        df = _normalize(df.drop(columns=[PARTITIONS[dataset]], errors="ignore"))
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        os.close(fd)
+        try:
+            df.to_parquet(tmp, index=False, schema=_schema(df))
+            os.replace(tmp, path)
+        except BaseException:
+            os.remove(tmp)
+            raise
+
+    def read(self, dataset: str, partition, name, columns=None) -> pd.DataFrame:
+        """Reads one entity's rows from a partition."""
+        return pd.read_parquet(self.path(dataset, partition, name), columns=columns, memory_map=True)
+
+    def query(self, dataset: str, columns=None, filters=None) -> pd.DataFrame:
+        """
+        Reads a whole dataset, pushing `filters` (pyarrow DNF, e.g.
+        [("PTS", ">=", 30)]) down to the Parquet readers and loading only `columns`.
+        The partition column (SEASON or TEAM_ID) can be filtered and selected too.
+        """
+        directory = os.path.join(self.root, dataset)
+        if not os.path.isdir(directory):
+            return pd.DataFrame(columns=columns)
+        df = pd.read_parquet(directory, columns=columns, filters=filters, memory_map=True)
+        return analysis.downcast_numeric(df)
+
+
+_default_warehouse = None
+
+def get_warehouse() -> Warehouse:
+    """Returns the default on-disk warehouse, creating it on first use."""
+    global _default_warehouse
+    if _default_warehouse is None:
+        _default_warehouse = Warehouse()
+    return _default_warehouse
@@ -0,0 +1,78 @@
+"""Background execution of GUI data loads.
+
+Blocking fetch-and-process jobs run on a thread pool; their results are
+handed back to the Tk thread through a queue polled with after(), so the
+window keeps redrawing while requests are in flight.
+"""
+
+import logging
+import queue
+from concurrent.futures import ThreadPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+
+class TaskRunner:
+    """Runs jobs off the Tk event loop and delivers results back on it.
+
+    Each job is submitted under a slot (typically the tab that asked for it).
+    Submitting a new job to a busy slot supersedes the old one: it is
+    cancelled if it has not started yet, and its result is discarded if it has.
+    """
+
+    def __init__(self, root, max_workers: int = 4, poll_interval: int = 50):
+        self.root = root
+        self.poll_interval = poll_interval
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="nba-ui")
+        self._results = queue.Queue()
+        self._current = {}  # slot -> (token, future, on_success, on_error)
+        self._poll_id = None
+
+    def submit(self, slot, func, on_success, on_error=None):
+        """Runs func() in the background, then calls on_success(result) or on_error(exc) on the Tk thread."""
+        previous = self._current.get(slot)
+        if previous is not None:
+            previous[1].cancel()
+        token = object()
+        future = self._executor.submit(func)
+        self._current[slot] = (token, future, on_success, on_error)
+        future.add_done_callback(lambda f: self._results.put((slot, token)))
+        if self._poll_id is None:
+            self._poll_id = self.root.after(self.poll_interval, self._poll)
+
+    def busy(self, slot) -> bool:
+        """Returns True if a job is in flight for the slot."""
+        return slot in self._current
+
+    def _poll(self):
+        """Drains finished jobs, dropping superseded ones, and reschedules while any are pending."""
+        try:
+            while True:
+                try:
+                    slot, token = self._results.get_nowait()
+                except queue.Empty:
+                    break
+                current = self._current.get(slot)
+                if current is None or current[0] is not token:
+                    continue
+                del self._current[slot]
+                _, future, on_success, on_error = current
+                error = future.exception()
+                try:
+                    if error is None:
+                        on_success(future.result())
+                    elif on_error is not None:
+                        on_error(error)
+                except Exception:
+                    # A failing callback must not stop results reaching the other slots.
+                    logger.exception("Result callback for %r failed", slot)
+        finally:
+            self._poll_id = self.root.after(self.poll_interval, self._poll) if self._current else None
+
+    def shutdown(self):
+        """Stops polling and abandons queued jobs."""
+        if self._poll_id is not None:
+            self.root.after_cancel(self._poll_id)
+            self._poll_id = None
+        self._current.clear()
+        self._executor.shutdown(wait=False, cancel_futures=True)
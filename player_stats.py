@@ -1,50 +1,40 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
-import pandas as pd
 import logging
-from rich.console import Console
-from rich.panel import Panel
 from datetime import datetime
-from nba_analyzer import api, analysis
-
-# Configure logging
-logging.basicConfig(
-    level=logging.DEBUG,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler("player_stats.log"),
-        logging.StreamHandler()
-    ]
-)
-logger = logging.getLogger("player_stats")
+from functools import cached_property
+from nba_analyzer import api, analysis, logs, prefetch, workers
+from nba_analyzer.lazy import lazy_import
+from nba_analyzer.ui import DataDisplayFrame
+
+pd = lazy_import("pandas")
 
-console = Console()
+logger = logging.getLogger("player_stats")
 
 class PlayerStatsAnalyzer:
-    def __init__(self):
+    def __init__(self, prefetcher: prefetch.Prefetcher | None = None):
         """Initialize the Player Stats Analyzer"""
-        self.players = api.get_all_players()
-        self.active_players = api.get_active_players()
         self.available_seasons = analysis.generate_seasons_list()
+        # Loads the seasons either side of each lookup in the background.
+        self.prefetcher = prefetch.Prefetcher() if prefetcher is None else prefetcher
+
+    @cached_property
+    def players(self) -> list[dict]:
+        """All players, loaded on first use."""
+        return api.get_all_players()
+
+    @cached_property
+    def active_players(self) -> list[dict]:
+        """Active players, loaded on first use."""
+        return api.get_active_players()
 
     def find_player_with_fallback(self, player_name: str) -> dict | None:
-        """Find a player, trying exact match first, then falling back to partial search."""
+        """Find a player, trying exact and partial matches first, then falling back to fuzzy search."""
         try:
-            # Use the API function for an exact match first
             return api.find_player(player_name)
         except ValueError:
-            # find_player failed, so no exact match. Try partial match.
-            # Partial match on active players
-            for player in self.active_players:
-                if player_name.lower() in player['full_name'].lower():
-                    return player
-            
-            # Partial match on all players
-            for player in self.players:
-                if player_name.lower() in player['full_name'].lower():
-                    return player
-            
-            return None
+            # No exact or partial match, so tolerate typos in the name.
+            return api.player_index().find(player_name, fuzzy=True)
 
     def get_player_stats(self, player_name: str, season: str, game_type: str = 'all'):
         """Get game logs for a specific player"""
@@ -55,7 +45,8 @@ class PlayerStatsAnalyzer:
         if not player_info:
             raise ValueError(f"Player '{player_name}' not found")
 
-        df = api.get_player_game_log(player_info['id'], season)
+        df = self.prefetcher.get(api.get_player_game_log, player_info['id'], season)
+        self.prefetcher.schedule(prefetch.after_player_season(player_info['id'], season))
         if df.empty:
             return df
 
@@ -63,9 +54,8 @@ class PlayerStatsAnalyzer:
 
         # Log the distribution of home/away games
         if 'LOCATION' in df.columns:
-            home_games = (df['LOCATION'] == 'Home').sum()
-            away_games = (df['LOCATION'] == 'Away').sum()
-            logger.debug(f"Total games: {len(df)}, Home games: {home_games}, Away games: {away_games}")
+            counts = df['LOCATION'].value_counts()
+            logger.debug(f"Total games: {len(df)}, Home games: {counts['Home']}, Away games: {counts['Away']}")
 
         # Filter based on game type if specified
         if game_type == 'home':
@@ -81,6 +71,8 @@ class PlayerStatsGUI:
         self.root.title("NBA Player Stats")
         self.root.geometry("1000x600")
         self.analyzer = PlayerStatsAnalyzer()
+        self.runner = workers.TaskRunner(self.root)
+        self.root.protocol("WM_DELETE_WINDOW", self.close)
         self.create_layout()
         
     def create_layout(self):
@@ -94,9 +86,8 @@ class PlayerStatsGUI:
         
         # Player selection
         ttk.Label(controls_frame, text="Select Player:").pack(side=tk.LEFT, padx=5)
-        self.player_combo = ttk.Combobox(controls_frame, width=30)
-        # Only show active players in the dropdown
-        self.player_combo['values'] = [player['full_name'] for player in self.analyzer.active_players]
+        # Only show active players in the dropdown, filled in when it is first opened
+        self.player_combo = ttk.Combobox(controls_frame, width=30, postcommand=self.load_player_names)
         self.player_combo.pack(side=tk.LEFT, padx=5)
         
         # Season selection
@@ -117,61 +108,72 @@ class PlayerStatsGUI:
         # Get Stats button
         ttk.Button(controls_frame, text="Get Stats", command=self.show_player_stats).pack(side=tk.LEFT, padx=5)
         
+        # Loading indicator
+        self.progress = ttk.Progressbar(controls_frame, mode="indeterminate", length=120)
+        self.progress.pack(side=tk.RIGHT, padx=5)
+        
         # Stats frame
         stats_frame = ttk.LabelFrame(main_frame, text="Player Statistics", padding="5")
         stats_frame.pack(fill=tk.BOTH, expand=True, pady=5)
         
         # Create table for stats
-        self.stats_tree = ttk.Treeview(stats_frame, show="headings")
-        self.stats_tree.pack(fill=tk.BOTH, expand=True)
-        
-        # Add scrollbars
-        y_scrollbar = ttk.Scrollbar(stats_frame, orient=tk.VERTICAL, command=self.stats_tree.yview)
-        y_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-        x_scrollbar = ttk.Scrollbar(stats_frame, orient=tk.HORIZONTAL, command=self.stats_tree.xview)
-        x_scrollbar.pack(side=tk.BOTTOM, fill=tk.X)
-        self.stats_tree.configure(yscrollcommand=y_scrollbar.set, xscrollcommand=x_scrollbar.set)
+        self.stats_table = DataDisplayFrame(stats_frame)
+        self.stats_table.pack(fill=tk.BOTH, expand=True)
+    
+    def load_player_names(self):
+        if not self.player_combo['values']:
+            self.player_combo['values'] = [player['full_name'] for player in self.analyzer.active_players]
     
     def show_player_stats(self):
-        try:
-            player_name = self.player_combo.get()
-            season = self.season_combo.get()
-            game_type = self.game_type_combo.get().lower().replace(' games', '')
-            
-            if not player_name or not season:
-                messagebox.showerror("Error", "Please select a player and season")
-                return
-            
-            # Get player stats
-            df = self.analyzer.get_player_stats(player_name, season, game_type)
-
-            if df.empty:
-                messagebox.showinfo("No Data", f"No game logs found for {player_name} in the {season} season.")
-                # Clear the treeview if no data
-                self.stats_tree.delete(*self.stats_tree.get_children())
-                return
-            
-            # Update table
-            self.stats_tree["columns"] = list(df.columns)
-            for col in df.columns:
-                self.stats_tree.heading(col, text=col)
-                self.stats_tree.column(col, width=100)
-            
-            # Clear existing items
-            for item in self.stats_tree.get_children():
-                self.stats_tree.delete(item)
-            
-            # Add data
-            for idx, row in df.iterrows():
-                self.stats_tree.insert("", tk.END, values=list(row))
-            
-        except Exception as e:
-            messagebox.showerror("Error", str(e))
+        player_name = self.player_combo.get()
+        season = self.season_combo.get()
+        game_type = self.game_type_combo.get().lower().replace(' games', '')
+        
+        if not player_name or not season:
+            messagebox.showerror("Error", "Please select a player and season")
+            return
+        
+        # Get player stats in the background; a newer request supersedes this one
+        self.progress.start()
+        self.runner.submit(
+            self,
+            lambda: self.analyzer.get_player_stats(player_name, season, game_type),
+            lambda df: self.display_player_stats(df, player_name, season),
+            self.display_error,
+        )
+    
+    def display_player_stats(self, df, player_name, season):
+        self.progress.stop()
+        if df.empty:
+            messagebox.showinfo("No Data", f"No game logs found for {player_name} in the {season} season.")
+            # Clear the table if no data
+            self.stats_table.update_data(pd.DataFrame())
+            return
+        
+        # Update table
+        self.stats_table.update_data(df)
+    
+    def display_error(self, error):
+        self.progress.stop()
+        messagebox.showerror("Error", str(error))
+    
+    def close(self):
+        self.runner.shutdown()
+        self.analyzer.prefetcher.close()
+        logger.info("Prefetch stats: %s", self.analyzer.prefetcher.stats())
+        self.root.destroy()
     
     def run(self):
         self.root.mainloop()
 
 if __name__ == "__main__":
+    # Configure logging
+    logs.configure("player_stats.log")
+
+    from rich.console import Console
+    from rich.panel import Panel
+
+    console = Console()
     console.print(Panel.fit(
         "[bold blue]NBA Player Stats[/bold blue]\n"
         "A simple tool for viewing NBA player statistics",